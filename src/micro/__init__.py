@@ -155,11 +155,12 @@ surprises.
 
 def __init__():
     import atexit
+    from   collections import OrderedDict
     from   ctypes import c_int, byref, addressof
+    from   functools import lru_cache
     import gzip
     import inspect
     import os
-    import platform
     import re
     import sys
 
@@ -168,19 +169,21 @@ def __init__():
     
     
     def log(*args):
-        STDOUT.write(' '.join(str(arg) for arg in args) + '\n')
+        if len(args) == 1:
+            STDOUT.write(str(args[0]) + '\n')
+        else:
+            STDOUT.write(' '.join(map(str, args)) + '\n')
         
     
-    def runtime():
-        if sys.platform == 'win32':
-            bit = 'x64' if sys.maxsize > 2**32 else 'x86'
-            return ['windows', bit]
-        elif sys.platform[:5] == 'linux':
-            return ['linux', platform.machine()]
+    if sys.platform == 'win32':
+        RUNTIME = ('windows', 'x64' if sys.maxsize > 2**32 else 'x86')
+    else:
+        import platform
+        RUNTIME = ('linux', platform.machine())
 
 
     os.environ['PYSDL2_DLL_PATH'] = os.path.abspath(
-            os.path.join(os.path.dirname(__file__), 'native', *runtime()))     
+            os.path.join(os.path.dirname(__file__), 'native', *RUNTIME))     
     from .sdl2 import (SDL_BLENDMODE_BLEND,
                        SDL_Color,
                        SDL_CreateRenderer,
@@ -191,7 +194,6 @@ def __init__():
                        SDL_DestroyRenderer,
                        SDL_DestroyTexture,
                        SDL_DestroyWindow,
-                       SDL_Event,
                        SDL_FLIP_HORIZONTAL,
                        SDL_FLIP_VERTICAL,
                        SDL_FreeSurface,
@@ -201,8 +203,8 @@ def __init__():
                        SDL_GetRenderDriverInfo,
                        SDL_GetRendererInfo,
                        SDL_GetTicks,
-                       SDL_GetWindowSize,
                        SDL_GetWindowTitle,
+                       SDL_HINT_OVERRIDE,
                        SDL_INIT_AUDIO,
                        SDL_INIT_JOYSTICK,
                        SDL_INIT_VIDEO,
@@ -222,7 +224,6 @@ def __init__():
                        SDL_PIXELFORMAT_RGB888,
                        SDL_PIXELFORMAT_RGBA8888,
                        SDL_Point,
-                       SDL_PollEvent,
                        SDL_QUIT,
                        SDL_Quit,
                        SDL_RENDERER_ACCELERATED,
@@ -235,14 +236,18 @@ def __init__():
                        SDL_RenderClear,
                        SDL_RenderCopy,
                        SDL_RenderCopyEx,
+                       SDL_RenderFillRect,
                        SDL_RenderGetViewport,
                        SDL_RenderPresent,
+                       SDL_RenderSetClipRect,
                        SDL_RenderSetViewport,
                        SDL_SetColorKey,
+                       SDL_SetHintWithPriority,
                        SDL_SetRenderDrawBlendMode,
                        SDL_SetRenderDrawColor,
                        SDL_SetRenderTarget,
                        SDL_SetTextureAlphaMod,
+                       SDL_SetTextureBlendMode,
                        SDL_SetTextureColorMod,
                        SDL_SetWindowFullscreen,
                        SDL_SetWindowSize,
@@ -252,6 +257,7 @@ def __init__():
                        SDL_TRUE,
                        SDL_WINDOWEVENT,
                        SDL_WINDOWEVENT_RESIZED,
+                       SDL_WINDOWEVENT_SIZE_CHANGED,
                        SDL_WINDOWPOS_CENTERED,
                        SDL_WINDOW_FULLSCREEN_DESKTOP,
                        SDL_WINDOW_RESIZABLE,
@@ -263,12 +269,14 @@ def __init__():
                               TTF_FontAscent,
                               TTF_FontLineSkip,
                               TTF_GetError,
+                              TTF_GlyphMetrics,
                               TTF_Init,
                               TTF_OpenFont,
                               TTF_OpenFontRW,
                               TTF_Quit,
                               TTF_RenderUTF8_Blended,
-                              TTF_RenderUTF8_Solid)
+                              TTF_RenderUTF8_Solid,
+                              TTF_SizeUTF8)
     from .sdl2.sdlmixer import (Mix_CloseAudio,
                                 MIX_DEFAULT_FORMAT,
                                 Mix_FreeChunk,
@@ -303,14 +311,17 @@ def __init__():
             self.rate   = 0
             self._count = 0
             self.last_update = None
-            self.frame_start = None
+            self.next_frame  = None
+            self.period      = None
+            self.period_fps  = None
     
         def update(self):
+            now = SDL_GetTicks()
             if self.last_update is None:
-                self.last_update = self.api.now()
+                self.last_update = now
             
-            if self.api.now() - self.last_update > 1.0:
-                self.last_update = self.api.now()
+            if now - self.last_update > 1000:
+                self.last_update = now
                 self.rate = self._count
                 self._count = 0
                 
@@ -320,18 +331,75 @@ def __init__():
             
             
         def limit(self, fps):
+            # Frames are paced against a running deadline rather than the end
+            # of the previous delay, so rounding to whole milliseconds doesn't
+            # accumulate into drift.
+            if fps != self.period_fps:
+                self.period     = 1000.0 / fps
+                self.period_fps = fps
+            
             now = SDL_GetTicks()
-            if self.frame_start is None:
-                self.frame_start = now
+            if self.next_frame is None or now - self.next_frame > self.period:
+                # First frame, or more than a frame behind; start again from now.
+                self.next_frame = now + self.period
             
-            delta = (now - self.frame_start)
-            target = 1000 // fps
+            delta = self.next_frame - now
+            if delta > 0:
+                SDL_Delay(int(delta))
             
-            if delta < target:
-                SDL_Delay(target - delta)
+            self.next_frame += self.period
+            
+    
+    class FontAtlas:
+        # Printable ASCII rendered as a single strip.  Only built for fonts whose
+        # printable ASCII is monospaced, where every character occupies an equal
+        # cell of the strip and drawing cell by cell matches rendering the whole
+        # line.
+        CHARACTERS = ''.join(map(chr, range(32, 127)))
+        
+        @classmethod
+        def cell_width(cls, ttf):
+            # Fonts don't reliably set their fixed-pitch flag (the builtin one 
+            # doesn't), so the glyphs are measured instead.  Every glyph must
+            # have the same advance and fit inside it.
+            minx, maxx, advance = c_int(), c_int(), c_int()
+            width = None
+            
+            for char in cls.CHARACTERS:
+                if TTF_GlyphMetrics(ttf, ord(char), byref(minx), byref(maxx), None, None, byref(advance)) != 0:
+                    return None
                 
-            self.frame_start = SDL_GetTicks()
+                if width is None:
+                    width = advance.value
+                if advance.value != width or minx.value < 0 or maxx.value > width:
+                    return None
             
+            return width or None
+        
+        
+        def __init__(self, texture, advance, height):
+            self.texture = texture
+            self.advance = advance
+            self.height  = height
+            self.rects   = {char: byref(SDL_Rect(index * advance, 0, advance, height))
+                            for index, char in enumerate(self.CHARACTERS)}
+        
+        
+        def covers(self, line):
+            return line.isascii() and line.isprintable()
+        
+        
+        def draw(self, renderer, line, dst):
+            rects   = self.rects
+            texture = self.texture
+            dst.w   = self.advance
+            dst.h   = self.height
+            dst_ref = byref(dst)
+            
+            for char in line:
+                SDL_RenderCopy(renderer, texture, rects[char], dst_ref)
+                dst.x += self.advance
+        
     
     class OutputRedirector:
         def __init__(self, api):
@@ -381,37 +449,63 @@ def __init__():
             self._draw_value = value    
 
     
-    def integer(value):
+    def integer(value, name):
+        if type(value) is int:
+            return value
+        
         try:
             return int(value)
         except (ValueError, TypeError):
-            raise TypeError('Could not convert {name} into a integer')
+            raise TypeError('Could not convert `%s` into a integer' % name)
             
     
-    def floating_point(value):
+    def floating_point(value, name):
+        if type(value) is float:
+            return value
+        
         try:
             return float(value)
         except (ValueError, TypeError):
-            raise TypeError('Could not convert {name} into a floating-point number')
+            raise TypeError('Could not convert `%s` into a floating-point number' % name)
             
             
-    def greater_than_zero(value):
+    def string(value, name):
+        return str(value)
+    
+    
+    def greater_than_zero(value, name):
         if value > 0:
             return value
         else:
-            raise ValueError('{name} must be greater than zero')
+            raise ValueError('`%s` must be greater than zero' % name)
     
     
-    def dir_exists(value):
+    def dir_exists(value, name):
         if os.path.exists(value) and os.path.isdir(value):
             return value
         else:
-            raise ValueError('{name} must be a path to an existing directory')
+            raise ValueError('`%s` must be a path to an existing directory' % name)
+    
+    
+    def validator(name, *rules, ignore_none=False):
+        def validate(value):
+            if ignore_none and value is None:
+                return
+            
+            for rule in rules:
+                value = rule(value, name)
+            
+            return value
+        
+        return validate
     
     
     class MicroPyApi:
-        def public(symbol):
+        PUBLIC = []
+        
+        def public(symbol, registry=PUBLIC):
             symbol.export = True
+            registry.append(symbol.__name__)
             return symbol
 
             
@@ -419,28 +513,44 @@ def __init__():
             if target is None:
                 target = globals()
         
-            for name in dir(self):
-                symbol = getattr(self, name)
-                if hasattr(symbol, 'export'):
-                    target[symbol.__name__] = symbol
+            for name in self.PUBLIC:
+                target[name] = getattr(self, name)
         
         
-        @staticmethod
-        def check_param(name, value, *rules, ignore_none=False):
-            if ignore_none and value is None:
-                return
-            
-            for rule in rules:
-                try:
-                    value = rule(value)
-                except Exception as error:
-                    raise type(error)(error.args[0].format(name='`%s`' % name))
-                    
-            return value
+        # Validators for the parameters of the public functions, built once 
+        # rather than on every call.
+        _check_window_width  = staticmethod(validator('width', integer, greater_than_zero))
+        _check_window_height = staticmethod(validator('height', integer, greater_than_zero))
+        _check_screen_width  = staticmethod(validator('width', integer, greater_than_zero, ignore_none=True))
+        _check_screen_height = staticmethod(validator('height', integer, greater_than_zero, ignore_none=True))
+        _check_resources_dir = staticmethod(validator('resources_dir', string, dir_exists, ignore_none=True))
+        _check_start         = staticmethod(validator('start', floating_point))
+        _check_size          = staticmethod(validator('size', integer, greater_than_zero))
+        _check_font_size     = staticmethod(validator('font_size', integer, greater_than_zero, ignore_none=True))
+        _check_x             = staticmethod(validator('x', integer, ignore_none=True))
+        _check_y             = staticmethod(validator('y', integer, ignore_none=True))
+        _check_width         = staticmethod(validator('width', integer, ignore_none=True))
+        _check_height        = staticmethod(validator('height', integer, ignore_none=True))
+        _check_tile_width    = staticmethod(validator('tile_width', integer, ignore_none=True))
+        _check_tile_height   = staticmethod(validator('tile_height', integer, ignore_none=True))
+        _check_angle         = staticmethod(validator('angle', floating_point))
+        _check_time          = staticmethod(validator('time', floating_point, ignore_none=True))
+        _check_target_fps    = staticmethod(validator('target_fps', integer, greater_than_zero, ignore_none=True))
+        _check_axis_index    = staticmethod(validator('axis_index', integer))
+        _check_direction     = staticmethod(validator('direction', integer))
+        _check_button_index  = staticmethod(validator('button_index', integer))
+        _check_volume        = staticmethod(validator('volume', floating_point))
+        
+        _TEXT_COLOR = SDL_Color(255, 255, 255, 255)
+        
+        TEXT_CACHE_SIZE = 256
                 
                 
         def __init__(self):
-            self.initialised = False
+            self.initialised        = False
+            self._atexit_registered = False
+            self._ttf_ready         = False
+            self._audio_ready       = False
             
             self.window     = None
             self.renderer   = None
@@ -452,11 +562,165 @@ def __init__():
             self.g        = None
             
             self.original_stdout = None
+            
+            # Scratch structures reused by the drawing functions instead of
+            # allocating new ctypes objects on every call.
+            self._dst_rect = SDL_Rect()
+            self._viewport = SDL_Rect()
+            self._text_w   = c_int()
+            
+            # The window's size, kept up to date from window events rather
+            # than asked for.
+            self._window_w = 0
+            self._window_h = 0
+            
+            # The backbuffer texture is only ever grown, so after resolution() 
+            # shrinks only the top left _back_rect of it is used.
+            self._back_rect    = SDL_Rect()
+            self._backbuffer_w = 0
+            self._backbuffer_h = 0
+            
+            # Where _update() copies the backbuffer to in the window, only 
+            # worked out again after the window or resolution changes.
+            self._present_rect   = SDL_Rect()
+            self._viewport_dirty = True
+            
+            # Rendered lines of text by (font, size, antialias, line), least 
+            # recently drawn first.  The textures are white and tinted per draw.
+            self._text_cache = OrderedDict()
+            
+            # Glyph atlases by (font, size, antialias), None for fonts that
+            # can't use one.
+            self._font_atlases = {}
+            
+            # The colour and alpha modulation last applied to each texture, by
+            # address, so unchanged state isn't sent to SDL again.
+            self._texture_mods  = {}
+            self._white_texture = None
+            
+            # The window title as last set or read, to skip setting it again.
+            self._title = None
+            
+            # Set by anything that changes the backbuffer or the window, so
+            # update() can skip presenting an unchanged frame.
+            self._dirty = True
+            
+            # update() leaves the window as the render target; the backbuffer
+            # is only bound again by the next draw.
+            self._target_is_back = False
+            
+            # Presents that must clear the window first, after a resize.
+            self._window_clears = 0
 
 
         def ensure_init(self):
             if not self.initialised:
                 self.init()
+        
+        
+        # Stands in for ensure_init() while initialised, so the check every
+        # public function starts with costs nothing.
+        @staticmethod
+        def _ensure_nothing():
+            pass
+        
+        
+        def _ensure_back(self):
+            if not self._target_is_back:
+                SDL_SetRenderTarget(self.renderer, self.backbuffer)
+                self._target_is_back = True
+                if self.width < self._backbuffer_w or self.height < self._backbuffer_h:
+                    SDL_RenderSetClipRect(self.renderer, self._back_rect)
+        
+        
+        def _set_texture_mod(self, texture, rgba):
+            address = addressof(texture.contents)
+            if self._texture_mods.get(address) != rgba:
+                r, g, b, a = rgba
+                SDL_SetTextureColorMod(texture, r, g, b)
+                SDL_SetTextureAlphaMod(texture, a)
+                self._texture_mods[address] = rgba
+        
+        
+        def _get_font_atlas(self, font_name, font_size, antialias, ttf, render):
+            key = (font_name, font_size, antialias)
+            if key in self._font_atlases:
+                return self._font_atlases[key]
+            
+            atlas   = None
+            advance = FontAtlas.cell_width(ttf)
+            if advance:
+                surface = render(ttf, FontAtlas.CHARACTERS.encode('ascii'), self._TEXT_COLOR)
+                if surface:
+                    texture = SDL_CreateTextureFromSurface(self.renderer, surface)
+                    if texture:
+                        atlas = FontAtlas(texture, advance, surface.contents.h)
+                    SDL_FreeSurface(surface)
+            
+            self._font_atlases[key] = atlas
+            return atlas
+        
+        
+        def _draw_image_fast(self, name, x, y):
+            # draw_image() given at most a position: the image is drawn at its 
+            # own size, unrotated and unflipped, in the draw colour.
+            x = int(self.g.x if x is None else x) + self.width // 2
+            y = self.height // 2 - int(self.g.y if y is None else y)
+            
+            parts = name.split('/', 2)
+            image = self.resources.get_image(parts[0])
+            src   = image.get_source_rect(parts[1] if len(parts) == 2 else '0', self.now())
+            
+            dst   = self._dst_rect
+            dst.x = x - src.w // 2
+            dst.y = y - src.h // 2
+            dst.w = src.w
+            dst.h = src.h
+            
+            if self._offscreen(dst.x, dst.y, dst.w, dst.h):
+                return
+            
+            self._set_texture_mod(image.texture, self.g._draw_color)
+            SDL_RenderCopy(self.renderer, image.texture, src, dst)
+        
+        
+        def _destroy_texture(self, texture):
+            self._texture_mods.pop(addressof(texture.contents), None)
+            SDL_DestroyTexture(texture)
+        
+        
+        def _offscreen(self, x, y, w, h, angle=0.0):
+            if w < 0:
+                x += w
+                w  = -w
+            if h < 0:
+                y += h
+                h  = -h
+            
+            if angle:
+                # Rotation is about the centre, so the result always fits in a
+                # square of side max(w, h) * sqrt(2) around it.
+                side = int(max(w, h) * 1.42) + 1
+                x   += (w - side) // 2
+                y   += (h - side) // 2
+                w    = h = side
+            
+            return x + w <= 0 or x >= self.width or y + h <= 0 or y >= self.height
+        
+        
+        # SDL_ttf and SDL_mixer are only started once text or audio is first
+        # used, so programs that only draw images don't pay for them.
+        def ensure_ttf(self):
+            if not self._ttf_ready:
+                TTF_Init()
+                self._ttf_ready = True
+        
+        
+        def ensure_audio(self):
+            if not self._audio_ready:
+                Mix_Init(0)
+                Mix_OpenAudio(44100, MIX_DEFAULT_FORMAT, 2, 1024)
+                self._audio_ready = True
 
 
         @public #P
@@ -499,11 +763,11 @@ def __init__():
             init().
             '''
             
-            width           = self.check_param('width', width, integer, greater_than_zero)
-            height          = self.check_param('height', height, integer, greater_than_zero)
+            width           = self._check_window_width(width)
+            height          = self._check_window_height(height)
             fullscreen      = bool(fullscreen) #potentially change to check param
             title           = str(title) if title is not None else None
-            resources_dir   = self.check_param('resources_dir', resources_dir, str, dir_exists, ignore_none=True)
+            resources_dir   = self._check_resources_dir(resources_dir)
             redirect_output = bool(redirect_output) #potentially change to check param
             
             if self.initialised:
@@ -511,8 +775,6 @@ def __init__():
                 
             SDL_Init(SDL_INIT_AUDIO | SDL_INIT_JOYSTICK | SDL_INIT_VIDEO)
             IMG_Init(0)
-            TTF_Init()
-            Mix_Init(0)
 
 
             if title is None:
@@ -535,6 +797,10 @@ def __init__():
             if not self.window:
                 self.dispose()
                 raise RuntimeError('Unable to create main window')
+            self._title          = None
+            self._viewport_dirty = True
+            self._window_w       = width
+            self._window_h       = height
 
             self.renderer = self.create_renderer()
             if not self.renderer:
@@ -547,9 +813,13 @@ def __init__():
             if not self.backbuffer:
                 self.dispose()
                 raise RuntimeError('Unable to create backbuffer')
+            
+            self._backbuffer_w = self._back_rect.w = width
+            self._backbuffer_h = self._back_rect.h = height
     
             SDL_SetRenderDrawBlendMode(self.renderer, SDL_BLENDMODE_BLEND)
             SDL_SetRenderTarget(self.renderer, self.backbuffer)
+            self._target_is_back = True
 
             self.resources_dirs = [resources_dir, os.path.join(os.path.dirname(__file__), 'builtin')]
         
@@ -557,13 +827,6 @@ def __init__():
             self.resources = ResourceManager(self)
             
             self.input    = InputHandler(self)
-
-            self.keys    = set()
-            self.buttons = {}
-            self.axis    = {}
-        
-            Mix_OpenAudio(44100, MIX_DEFAULT_FORMAT, 2, 1024)
-
             
             if redirect_output:
                 self.original_stdout = sys.stdout
@@ -571,13 +834,18 @@ def __init__():
         
             self._running     = True
             self.initialised = True
+            self.ensure_init = self._ensure_nothing
         
             self._fullscreen = None
             self.fullscreen(fullscreen)
                 
             self.clear()
             
-            atexit.register(self.quit)
+            # quit() tears down whatever the latest init() created, so it only
+            # needs registering once however many times init() is called.
+            if not self._atexit_registered:
+                atexit.register(self.quit)
+                self._atexit_registered = True
             
 
         @public #P
@@ -608,6 +876,18 @@ def __init__():
                 SDL_DestroyTexture(self.backbuffer)
                 self.backbuffer = None
             
+            for texture, _, _ in self._text_cache.values():
+                SDL_DestroyTexture(texture)
+            self._text_cache.clear()
+            
+            for atlas in self._font_atlases.values():
+                if atlas is not None:
+                    SDL_DestroyTexture(atlas.texture)
+            self._font_atlases.clear()
+            
+            self._texture_mods.clear()
+            self._white_texture = None
+            
             if self.renderer:
                 SDL_DestroyRenderer(self.renderer)
                 self.renderer = None
@@ -620,14 +900,20 @@ def __init__():
                 sys.stdout = self.original_stdout
                 self.original_stdout = None
 
-            Mix_CloseAudio()
-
-            Mix_Quit()
-            TTF_Quit()
+            if self._audio_ready:
+                Mix_CloseAudio()
+                Mix_Quit()
+                self._audio_ready = False
+            
+            if self._ttf_ready:
+                TTF_Quit()
+                self._ttf_ready = False
+            
             IMG_Quit()
             SDL_Quit()
 
             self.initialised = False
+            del self.ensure_init
             
         
         @public #P
@@ -651,7 +937,10 @@ def __init__():
             
             self.ensure_init()
             
-            self.check_param('start', start, floating_point)
+            if start == 0.0:
+                return SDL_GetTicks() / 1000.0
+            
+            start = self._check_start(start)
             
             return (SDL_GetTicks() / 1000.0) - start
                 
@@ -780,10 +1069,22 @@ def __init__():
                 If no font by the given name can be found in the resources_dir.
             '''
             
-            name = self.font_name(name)
-            size = self.font_size(size)
+            self.ensure_init()
+            
+            # Validate both before changing anything, and load the font once at
+            # the size it will actually be drawn with.
+            if size is not None:
+                size = self._check_size(size)
+            
+            if name is not None:
+                name = str(name).strip().lower()
+                self.resources.get_font(name, size if size is not None else self.g.font_size)
+                self.g.font = name
+            
+            if size is not None:
+                self.g.font_size = size
             
-            return name, size
+            return self.g.font, self.g.font_size
 
             
         @public #P
@@ -847,7 +1148,7 @@ def __init__():
             self.ensure_init()
             
             if size is not None:
-                size = self.check_param('size', size, integer, greater_than_zero)
+                size = self._check_size(size)
                 self.g.font_size = size
                 
             return self.g.font_size
@@ -877,9 +1178,9 @@ def __init__():
             self.ensure_init()
             
             if x is not None:
-                self.g.x = self.check_param('x', x, integer)
+                self.g.x = self._check_x(x)
             if y is not None:
-                self.g.y = self.check_param('y', y, integer)
+                self.g.y = self._check_y(y)
             
             return self.g.x, self.g.y
         
@@ -900,9 +1201,12 @@ def __init__():
             int
                 The x location of the graphics cursor.
             '''
-
-            x, _ = location(x)
-            return x
+            self.ensure_init()
+            
+            if x is not None:
+                self.g.x = self._check_x(x)
+            
+            return self.g.x
         
         @public #P
         def location_y(self, y=None):
@@ -921,13 +1225,27 @@ def __init__():
             int
                 The y location of the graphics cursor.
             '''
-
-            _, y = location(y=y)
-            return y
+            self.ensure_init()
+            
+            if y is not None:
+                self.g.y = self._check_y(y)
+            
+            return self.g.y
             
         
+        # Only a handful of distinct flip strings are ever used, so each one is
+        # translated once; the usual empty string doesn't reach the cache.
         @staticmethod
         def flip_str_to_flags(flip_str):
+            if not flip_str:
+                return 0
+            
+            return MicroPyApi.parse_flip_str(flip_str)
+        
+        
+        @staticmethod
+        @lru_cache(maxsize=64)
+        def parse_flip_str(flip_str):
             flip_flags = 0
             for ch in flip_str.lower().strip():
                 if ch in '-h':
@@ -959,6 +1277,8 @@ def __init__():
                 The colour to fill the background of the graphics window with.
             '''
             self.ensure_init()
+            self._ensure_back()
+            self._dirty = True
             
             self.g.x = 0
             self.g.y = 0
@@ -1010,16 +1330,23 @@ def __init__():
             '''
             
             self.ensure_init()
+            self._ensure_back()
+            self._dirty = True
+            
+            if (width is None and height is None and flip == '' and angle == 0.0 
+                    and time is None and color is None
+                    and (x is None or type(x) is int) and (y is None or type(y) is int)):
+                self._draw_image_fast(str(name), x, y)
+                return
 
             name   = str(name) #potentially change to check param
-            x      = self.check_param('x', x, integer, ignore_none=True)
-            y      = self.check_param('y', y, integer, ignore_none=True)
-            width  = self.check_param('width', width, integer, ignore_none=True)
-            height = self.check_param('height', height, integer, ignore_none=True)
+            x      = self._check_x(x)
+            y      = self._check_y(y)
+            width  = self._check_width(width)
+            height = self._check_height(height)
             flip   = str(flip) #potentially change to check param
-            angle  = self.check_param('angle', angle, floating_point)
-            time   = self.check_param('time', time, floating_point, ignore_none=True)
-            color  = str(color) if color is not None else None #potentially change to check param
+            angle  = self._check_angle(angle)
+            time   = self._check_time(time)
             
             if time is None: time = self.now()
             
@@ -1051,7 +1378,11 @@ def __init__():
             elif height is None: 
                 height = int((src.h / src.w) * width)
             
-            dst = SDL_Rect(x - width // 2, y - height // 2, width, height)
+            dst   = self._dst_rect
+            dst.x = x - width // 2
+            dst.y = y - height // 2
+            dst.w = width
+            dst.h = height
             
             flip_flags = self.flip_str_to_flags(flip)
             
@@ -1063,15 +1394,23 @@ def __init__():
                 flip_flags |= SDL_FLIP_VERTICAL
             
             if color is None:
-                r, g, b, a = self.g._draw_color
+                rgba = self.g._draw_color
             else:
-                r, g, b, a = color_from_name(color)
+                rgba = color_from_name(str(color))
+            
+            if self._offscreen(dst.x, dst.y, dst.w, dst.h, angle):
+                return
             
             texture = image.texture
             
-            SDL_SetTextureColorMod(texture, r, g, b)
-            SDL_SetTextureAlphaMod(texture, a)
-            SDL_RenderCopyEx(self.renderer, texture, src, dst, angle, None, flip_flags)
+            self._set_texture_mod(texture, rgba)
+            
+            # Plain copies are cheaper for SDL and batch with neighbouring 
+            # copies from the same texture.
+            if angle == 0.0 and flip_flags == 0:
+                SDL_RenderCopy(self.renderer, texture, src, dst)
+            else:
+                SDL_RenderCopyEx(self.renderer, texture, src, dst, angle, None, flip_flags)
 
 
         @public #P
@@ -1097,13 +1436,14 @@ def __init__():
             '''
             
             self.ensure_init()
+            self._ensure_back()
+            self._dirty = True
             
-            x      = self.check_param('x', x, integer, ignore_none=True)
-            y      = self.check_param('y', y, integer, ignore_none=True)
-            width  = abs(self.check_param('width', width, integer, ignore_none=True))
-            height = abs(self.check_param('height', height, integer, ignore_none=True))
-            angle  = self.check_param('angle', angle, floating_point)
-            color  = str(color) if color is not None else None #potentially change to check param
+            x      = self._check_x(x)
+            y      = self._check_y(y)
+            width  = abs(self._check_width(width))
+            height = abs(self._check_height(height))
+            angle  = self._check_angle(angle)
             
             if width == 0 or height == 0:
                 return
@@ -1123,16 +1463,32 @@ def __init__():
             if color is None:
                 color = self.g._fill_color
             else:
-                color = color_from_name(color)
-                
-            texture = self.resources.get_image('.white', internal=True).texture
+                color = color_from_name(str(color))
+            
+            if self._offscreen(x - width // 2, y - height // 2, width, height, angle):
+                return
             
-            rect = SDL_Rect(x - width // 2, y - height // 2, width, height)
+            rect   = self._dst_rect
+            rect.x = x - width // 2
+            rect.y = y - height // 2
+            rect.w = width
+            rect.h = height
+            
+            # Only rotated rectangles need the white texture; SDL batches plain
+            # fills without binding any texture.
+            if angle == 0.0:
+                SDL_SetRenderDrawColor(self.renderer, *color)
+                SDL_RenderFillRect(self.renderer, rect)
+                return
             
-            r, g, b, a = color
-
-            SDL_SetTextureColorMod(texture, r, g, b)
-            SDL_SetTextureAlphaMod(texture, a)
+            texture = self._white_texture
+            if texture is None:
+                # The white image has no alpha channel, so it has to be told to
+                # blend like the SDL_RenderFillRect path does.
+                texture = self._white_texture = self.resources.get_image('.white', internal=True).texture
+                SDL_SetTextureBlendMode(texture, SDL_BLENDMODE_BLEND)
+            
+            self._set_texture_mod(texture, color)
             SDL_RenderCopyEx(self.renderer, texture, None, rect, angle, None, 0)
 
             
@@ -1180,19 +1536,20 @@ def __init__():
             '''
             
             self.ensure_init()
+            self._ensure_back()
+            self._dirty = True
             
             text      = str(text)
-            x         = self.check_param('x', x, integer, ignore_none=True)
-            y         = self.check_param('y', y, integer, ignore_none=True)
+            x         = self._check_x(x)
+            y         = self._check_y(y)
             antialias = bool(antialias)
             font_name = str(font_name) if font_name is not None else None
-            font_size = self.check_param('font_size', font_size, integer, greater_than_zero, ignore_none=True)
-            color     = str(color) if color is not None else None
+            font_size = self._check_font_size(font_size)
             
             if color is None:
                 rgba = self.g._draw_color
             else:
-                rgba = color_from_name(color)
+                rgba = color_from_name(str(color))
             
             if font_size is None:
                 font_size = self.g.font_size
@@ -1203,33 +1560,79 @@ def __init__():
             ttf = self.resources.get_font(font_name, font_size)
                 
             render = TTF_RenderUTF8_Blended if antialias else TTF_RenderUTF8_Solid
-            color  = SDL_Color(255, 255, 255, 255)
+            color  = self._TEXT_COLOR
             assent = TTF_FontAscent(ttf)
             line_h = TTF_FontLineSkip(ttf)
-            r, g, b, a = rgba
             
             
             x = self.g.x if x is None else x
             y = self.g.y if y is None else y
             
             left = x
+            dst  = self._dst_rect
+            
+            text_cache  = self._text_cache
+            atlas       = self._get_font_atlas(font_name, font_size, antialias, ttf, render)
+            renderer    = self.renderer
+            half_w      = self.width // 2
+            half_h      = self.height // 2
+            line_start  = -self.width // 2
+            text_w      = self._text_w
             
             #center parameter
-            for line in re.split(r'(\n)', text):
-                if line == '\n':
+            for index, line in enumerate(text.split('\n')):
+                if index:
                     y -= line_h
-                    x  = -self.width // 2
-                elif line:
+                    x  = line_start
+                
+                if not line:
+                    continue
+                
+                top     = (half_h - y) - assent
+                visible = top < self.height and top + line_h > 0 and x + half_w < self.width
+                
+                # Fixed-width fonts always draw printable ASCII from their glyph
+                # atlas, so the same text looks the same on every frame.
+                if atlas is not None and atlas.covers(line):
+                    if visible:
+                        self._set_texture_mod(atlas.texture, rgba)
+                        dst.x = x + half_w
+                        dst.y = top
+                        atlas.draw(renderer, line, dst)
+                    x += atlas.advance * len(line)
+                    continue
+                
+                key    = (font_name, font_size, antialias, line)
+                cached = text_cache.get(key)
+                
+                if not visible:
+                    # Lines that can't be seen are only measured, to move the
+                    # cursor, and never rendered.
+                    if cached is not None:
+                        x += cached[1]
+                    else:
+                        TTF_SizeUTF8(ttf, line.encode('utf-8'), byref(text_w), None)
+                        x += text_w.value
+                    continue
+                
+                if cached is None:
                     surface = render(ttf, line.encode('utf-8'), color)
-                    texture = SDL_CreateTextureFromSurface(self.renderer, surface)
-                    SDL_SetTextureColorMod(texture, r, g, b)
-                    SDL_SetTextureAlphaMod(texture, a)
-                    dst = SDL_Rect((x + self.width // 2), (self.height // 2 - y) - assent, surface.contents.w, surface.contents.h)
+                    texture = SDL_CreateTextureFromSurface(renderer, surface)
+                    cached  = text_cache[key] = (texture, surface.contents.w, surface.contents.h)
                     SDL_FreeSurface(surface)
-                    SDL_RenderCopy(self.renderer, texture, None, dst)
-                    SDL_DestroyTexture(texture)
                     
-                    x += dst.w
+                    if len(text_cache) > self.TEXT_CACHE_SIZE:
+                        self._destroy_texture(text_cache.popitem(last=False)[1][0])
+                else:
+                    text_cache.move_to_end(key)
+                
+                texture, dst.w, dst.h = cached
+                self._set_texture_mod(texture, rgba)
+                dst.x = x + half_w
+                dst.y = top
+                SDL_RenderCopy(renderer, texture, None, dst)
+                
+                x += dst.w
             
             self.g.x = x
             self.g.y = y
@@ -1264,14 +1667,15 @@ def __init__():
                 colour.
             '''
             self.ensure_init()
+            self._ensure_back()
+            self._dirty = True
             
             name        = str(name)
-            x           = self.check_param('x', x, integer, ignore_none=True)
-            y           = self.check_param('y', y, integer, ignore_none=True)
-            tile_width  = abs(self.check_param('tile_width', tile_width, integer, ignore_none=True))
-            tile_height = abs(self.check_param('tile_height', tile_height, integer, ignore_none=True))
-            time        = self.check_param('time', time, floating_point, ignore_none=True)
-            color       = str(color) if color is not None else None #potentially change to check param
+            x           = self._check_x(x)
+            y           = self._check_y(y)
+            tile_width  = abs(self._check_tile_width(tile_width))
+            tile_height = abs(self._check_tile_height(tile_height))
+            time        = self._check_time(time)
             
             if time is None:
                 time = self.now()
@@ -1286,12 +1690,11 @@ def __init__():
             texture = tileset.texture
             
             if color is None:
-                r, g, b, a = self.g._draw_color
+                rgba = self.g._draw_color
             else:
-                r, g, b, a = color_from_name(color)
+                rgba = color_from_name(str(color))
             
-            SDL_SetTextureColorMod(texture, r, g, b)
-            SDL_SetTextureAlphaMod(texture, a)
+            self._set_texture_mod(texture, rgba)
             
             if tile_width is None and tile_height is None:
                 tile_width  = tileset.tile_width
@@ -1318,18 +1721,38 @@ def __init__():
             start_y = abs(top // tile_height) - 1 if top < 0 else 0
             end_y   = (tilemap.height - bottom // tile_height + screen_h) + 1 if bottom // tile_height > screen_h else tilemap.height
             
-            dst = SDL_Rect(0, 0, tile_width, tile_height)
+            if start_x >= end_x:
+                return
+            
+            # Walk only the occupied cells of each visible row, resolving the
+            # source rectangle of each distinct tile id once per draw.  The 
+            # rects are passed as prepared references, keeping the per-tile 
+            # work down to the copy itself.
+            occupied_cells = tilemap.occupied_cells
+            id_to_tile     = tilemap.id_to_tile
+            sources        = {}
+            renderer       = self.renderer
+            copy           = SDL_RenderCopy
+            
+            dst     = self._dst_rect
+            dst.w   = tile_width
+            dst.h   = tile_height
+            dst_ref = byref(dst)
+            
+            # Screen positions of every column and row, indexed by cell.
+            xs = range(left, right, tile_width)
+            ys = range(top, bottom, tile_height)
+            
             for r in range(start_y, end_y):
-                for c in range(start_x, end_x):
-                    tile = tilemap.get(c, r)
-                    if tile == '0': continue
-                    
-                    src = tileset.get_source_rect(tile, time)
-                    
-                    dst.x = left + c * tile_width
-                    dst.y = top + r * tile_height
+                dst.y = ys[r]
+                
+                for c, id in occupied_cells(r, start_x, end_x):
+                    src = sources.get(id)
+                    if src is None:
+                        src = sources[id] = byref(tileset.get_source_rect(id_to_tile[id], time))
                     
-                    SDL_RenderCopy(self.renderer, texture, src, dst)
+                    dst.x = xs[c]
+                    copy(renderer, texture, src, dst_ref)
         
         
         @public #P
@@ -1352,19 +1775,26 @@ def __init__():
             
             self.ensure_init()
             
-            target_fps = self.check_param('target_fps', target_fps, integer, greater_than_zero, ignore_none=True)
+            target_fps = self._check_target_fps(target_fps)
             
             self.input.update()
             
             self.poll()
             
-            SDL_SetRenderTarget(self.renderer, None)
-            self._update()
-            SDL_RenderPresent(self.renderer)
+            if self._dirty:
+                if self._target_is_back:
+                    SDL_SetRenderTarget(self.renderer, None)
+                    self._target_is_back = False
+                if self._window_clears:
+                    SDL_SetRenderDrawColor(self.renderer, 0, 0, 0, 255)
+                    SDL_RenderClear(self.renderer)
+                    self._window_clears -= 1
+                self._update()
+                SDL_RenderPresent(self.renderer)
+                self._dirty = False
+            
             if target_fps is not None:
                 self.frames.limit(target_fps)
-                
-            SDL_SetRenderTarget(self.renderer, self.backbuffer)
             
             self.frames.count()
             
@@ -1381,7 +1811,7 @@ def __init__():
             '''
         
             self.ensure_init()
-            return set(self.input.keys.keys())
+            return set(self.input.keys.values())
             
             
         @public #P
@@ -1595,8 +2025,8 @@ def __init__():
             '''
             self.ensure_init()
             
-            axis_index = self.check_param('axis_index', axis_index, integer)
-            direction  = self.check_param('direction', direction, integer)
+            axis_index = self._check_axis_index(axis_index)
+            direction  = self._check_direction(direction)
             
             # TODO
             return self.input.get_daxis(axis_index, (1 if direction >= 0 else 0), joystick)
@@ -1622,7 +2052,7 @@ def __init__():
             '''
             self.ensure_init()
             
-            axis_index = self.check_param('axis_index', axis_index, integer)
+            axis_index = self._check_axis_index(axis_index)
             
             return self.input.get_axis(axis_index, joystick)
             
@@ -1664,7 +2094,7 @@ def __init__():
             '''
             self.ensure_init()
             
-            button_index = self.check_param('button_index', button_index, integer)
+            button_index = self._check_button_index(button_index)
             
             return self.input.get_button(button_index, joystick)
             
@@ -1686,31 +2116,48 @@ def __init__():
             return self.frames.rate
             
         
+        # Render drivers by how well SDL batches their draw calls; drivers not
+        # listed score 1.
+        BATCHING_DRIVERS = {b'opengl':     2, 
+                            b'opengles2':  2, 
+                            b'direct3d':   2,
+                            b'direct3d11': 0,
+                            b'metal':      0}
+        
+        # Usable render drivers, best first, filled by the first create_renderer().
+        _driver_scores = None
+        
         def create_renderer(self):
-            scores = []
+            # Let SDL coalesce consecutive copies into fewer GPU submissions.
+            # Drawing only ever goes through the renderer, so this is safe.
+            SDL_SetHintWithPriority(b'SDL_RENDER_BATCHING', b'1', SDL_HINT_OVERRIDE)
             
-            for c_index in range(SDL_GetNumRenderDrivers()):
-                info = SDL_RendererInfo()
-                SDL_GetRenderDriverInfo(c_index, byref(info))
+            scores = self._driver_scores
+            if scores is None:
+                scores = []
                 
-                if info.flags & SDL_RENDERER_TARGETTEXTURE:
-                    c_score = 0
-                    c_accel = 0
-                    if not(info.flags & SDL_RENDERER_ACCELERATED):
-                        c_score += 1
-                        c_accel = SDL_RENDERER_ACCELERATED
+                for c_index in range(SDL_GetNumRenderDrivers()):
+                    info = SDL_RendererInfo()
+                    SDL_GetRenderDriverInfo(c_index, byref(info))
                     
-                    scores.append((c_score, info))
-            
-            
-            scores.sort(key=lambda t: (t[0], t[1].name), reverse=True)
+                    if info.flags & SDL_RENDERER_TARGETTEXTURE:
+                        c_score = 1 if info.flags & SDL_RENDERER_ACCELERATED else 0
+                        
+                        c_batching = self.BATCHING_DRIVERS.get(info.name, 1)
+                        
+                        scores.append((c_score, c_batching, c_index, info))
+                
+                scores.sort(key=lambda t: (t[0], t[1], t[3].name), reverse=True)
+                
+                # The available drivers don't change while the process runs.
+                type(self)._driver_scores = scores
             
             index    = 0
             renderer = None
             while not renderer and index < len(scores):
-                score, info = scores[index]
+                score, batching, c_index, info = scores[index]
                 renderer = SDL_CreateRenderer(
-                    self.window, index, 
+                    self.window, c_index, 
                     info.flags & (SDL_RENDERER_ACCELERATED | 
                                   SDL_RENDERER_SOFTWARE | 
                                   SDL_RENDERER_TARGETTEXTURE))
@@ -1741,8 +2188,11 @@ def __init__():
             '''
             self.ensure_init()
             
-            width  = self.check_param('width', width, integer, greater_than_zero, ignore_none=True)
-            height = self.check_param('height', height, integer, greater_than_zero, ignore_none=True)
+            if width is None and height is None:
+                return self.width, self.height
+            
+            width  = self._check_screen_width(width)
+            height = self._check_screen_height(height)
             
             set = width or height
             
@@ -1755,27 +2205,44 @@ def __init__():
                 raise ValueError('height must be between 1 and 2048')    
             
             if set:
-                if self.backbuffer:
-                    SDL_DestroyTexture(self.backbuffer)
+                if width > self._backbuffer_w or height > self._backbuffer_h:
+                    backbuffer_w = max(width, self._backbuffer_w)
+                    backbuffer_h = max(height, self._backbuffer_h)
                     
-                self.backbuffer = SDL_CreateTexture(
-                        self.renderer, SDL_PIXELFORMAT_RGB888,
-                        SDL_TEXTUREACCESS_TARGET, width, height)
-                if not self.backbuffer:
-                    self.dispose()
-                    raise RuntimeError('Unable to create backbuffer')
+                    if self.backbuffer:
+                        SDL_DestroyTexture(self.backbuffer)
+                        
+                    # Destroying the bound backbuffer resets the render target.
+                    self._target_is_back = False
+                    self.backbuffer = SDL_CreateTexture(
+                            self.renderer, SDL_PIXELFORMAT_RGB888,
+                            SDL_TEXTUREACCESS_TARGET, backbuffer_w, backbuffer_h)
+                    if not self.backbuffer:
+                        self.dispose()
+                        raise RuntimeError('Unable to create backbuffer')
+                    
+                    self._backbuffer_w = backbuffer_w
+                    self._backbuffer_h = backbuffer_h
             
-                self.width  = width
-                self.height = height
+                self.width  = self._back_rect.w = width
+                self.height = self._back_rect.h = height
+                self._dirty = self._viewport_dirty = True
                 
-                window_w = c_int()
-                window_h = c_int()
-                SDL_GetWindowSize(self.window, byref(window_w), byref(window_h))
-                window_w = window_w.value
-                window_h = window_h.value
+                if self._target_is_back:
+                    if width < self._backbuffer_w or height < self._backbuffer_h:
+                        SDL_RenderSetClipRect(self.renderer, self._back_rect)
+                    else:
+                        SDL_RenderSetClipRect(self.renderer, None)
                 
-                if self.width > window_w or self.height > window_h:
+                if self.width > self._window_w or self.height > self._window_h:
                     SDL_SetWindowSize(self.window, self.width, self.height)
+                    
+                    # A fullscreen window keeps its size; the new windowed size
+                    # only applies, and is reported by an event, once it leaves
+                    # fullscreen.
+                    if not self._fullscreen:
+                        self._window_w = self.width
+                        self._window_h = self.height
             
             return width, height
         
@@ -1795,9 +2262,12 @@ def __init__():
             int
                 The current width of screen resolution.
             '''
-            #function needs implementing
-
-            return resolution(width)[0]
+            if width is not None:
+                self.resolution(width)
+            else:
+                self.ensure_init()
+            
+            return self.width
         
         @public #P
         def resolution_height(self, height=None):
@@ -1814,9 +2284,12 @@ def __init__():
             int
                 The current height of screen resolution.
             '''
-            #function needs implementing
-
-            return resolution(height=height)[1]
+            if height is not None:
+                self.resolution(height=height)
+            else:
+                self.ensure_init()
+            
+            return self.height
         
         
         @public #P
@@ -1840,9 +2313,14 @@ def __init__():
             self.ensure_init()
             
             if title is not None:
-                SDL_SetWindowTitle(self.window, str(title).encode())
-            
-            return SDL_GetWindowTitle(self.window).decode()
+                title = str(title)
+                if title != self._title:
+                    SDL_SetWindowTitle(self.window, title.encode())
+                    self._title = title
+            elif self._title is None:
+                self._title = SDL_GetWindowTitle(self.window).decode()
+            
+            return self._title
         
         
         @public #P
@@ -1867,7 +2345,9 @@ def __init__():
                 if fullscreen != self._fullscreen:
                     SDL_SetWindowFullscreen(self.window, SDL_WINDOW_FULLSCREEN_DESKTOP if fullscreen else 0)
                     SDL_ShowCursor(1 if not fullscreen else 0)
-                    self._fullscreen = fullscreen
+                    self._fullscreen     = fullscreen
+                    self._dirty          = True
+                    self._viewport_dirty = True
         
             return self._fullscreen
         
@@ -1875,47 +2355,66 @@ def __init__():
         #@public #g
         def poll(self):
             self.ensure_init()
+            
+            resized = False
 
-            event = SDL_Event()
-            while SDL_PollEvent(event):
-                if event.type == SDL_QUIT:
+            for event in self.input.pump():
+                event_type = event.type
+                if event_type == SDL_QUIT:
                     self._running = False
-                elif event.type == SDL_WINDOWEVENT:
-                    if event.window.event == SDL_WINDOWEVENT_RESIZED:
-                        SDL_SetRenderTarget(self.renderer, None)
-                        SDL_RenderSetViewport(self.renderer, None)
-                        
-                        SDL_SetRenderDrawColor(self.renderer, 0, 0, 0, 255)
-                        
-                        SDL_RenderClear(self.renderer)
-                        self._update()
-                        SDL_RenderPresent(self.renderer)
-                        
-                        SDL_RenderClear(self.renderer)
-                        self._update()
-                        SDL_RenderPresent(self.renderer)
-                        
-                        SDL_SetRenderTarget(self.renderer, self.backbuffer)
-                elif event.type == SDL_KEYDOWN:
-                    if event.key.keysym.sym == SDLK_ESCAPE:
+                elif event_type == SDL_WINDOWEVENT:
+                    self._dirty = True
+                    window = event.window
+                    if window.event == SDL_WINDOWEVENT_SIZE_CHANGED:
+                        self._window_w = window.data1
+                        self._window_h = window.data2
+                        self._viewport_dirty = True
+                    elif window.event == SDL_WINDOWEVENT_RESIZED:
+                        self._window_w = window.data1
+                        self._window_h = window.data2
+                        resized = True
+                elif event_type == SDL_KEYDOWN:
+                    key = event.key
+                    sym = key.keysym.sym
+                    if sym == SDLK_ESCAPE:
                         self._running = False
-                    elif event.key.keysym.sym == SDLK_F11 and not event.key.repeat:
+                    elif sym == SDLK_F11 and not key.repeat:
                         self.fullscreen(not self.fullscreen())
                         
                 self.input.process(event)
+            
+            # Dragging the window edge queues many resizes; only the last one 
+            # matters, and the frame that update() presents next shows it.
+            if resized:
+                SDL_SetRenderTarget(self.renderer, None)
+                self._target_is_back = False
+                SDL_RenderSetViewport(self.renderer, None)
+                self._viewport_dirty = True
+                
+                # Both of the window's buffers need the old image cleared from
+                # around the letterboxed backbuffer.
+                self._window_clears = 2
 
             return self._running
 
 
         def _update(self):
-            screen = SDL_Rect()
-            SDL_RenderGetViewport(self.renderer, byref(screen))
-            
-            scale  = min(screen.w / self.width, screen.h / self.height)
-            width  = int(self.width * scale)
-            height = int(self.height * scale)
-            rect   = SDL_Rect((screen.w - width) // 2, (screen.h - height) // 2, width, height)
-            SDL_RenderCopy(self.renderer, self.backbuffer, None, rect)
+            rect = self._present_rect
+            if self._viewport_dirty:
+                screen = self._viewport
+                SDL_RenderGetViewport(self.renderer, byref(screen))
+                
+                scale  = min(screen.w / self.width, screen.h / self.height)
+                width  = int(self.width * scale)
+                height = int(self.height * scale)
+                
+                rect.x = (screen.w - width) // 2
+                rect.y = (screen.h - height) // 2
+                rect.w = width
+                rect.h = height
+                self._viewport_dirty = False
+                
+            SDL_RenderCopy(self.renderer, self.backbuffer, self._back_rect, rect)
             
         #potentially make this a parameter
         @public #P
@@ -1944,6 +2443,20 @@ def __init__():
             return self._running
 
 
+        # Mixer volumes for the usual volume arguments, which then skip the
+        # validation and scaling.
+        _MIX_VOLUMES = {1.0: MIX_MAX_VOLUME, 0.5: MIX_MAX_VOLUME // 2, 0.0: 0}
+        
+        def _mix_volume(self, volume):
+            if type(volume) is float:
+                mix_volume = self._MIX_VOLUMES.get(volume)
+                if mix_volume is not None:
+                    return mix_volume
+            
+            volume = self._check_volume(volume)
+            return int(max(0, min(MIX_MAX_VOLUME, (MIX_MAX_VOLUME * float(volume)))))
+
+
         @public #P
         def play_sound(self, name, volume=1.0):
             '''
@@ -1959,8 +2472,7 @@ def __init__():
             self.ensure_init()
             #no check param for name
             
-            volume = self.check_param('volume', volume, floating_point)
-            volume = int(max(0, min(MIX_MAX_VOLUME, (MIX_MAX_VOLUME * float(volume)))))
+            volume = self._mix_volume(volume)
             
             chunk = self.resources.get_sound(name)
             channel = Mix_PlayChannel(-1, chunk, 0)
@@ -1982,8 +2494,7 @@ def __init__():
             '''
             self.ensure_init()
             #no check param for name
-            volume = self.check_param('volume', volume, floating_point)
-            volume = int(max(0, min(MIX_MAX_VOLUME, (MIX_MAX_VOLUME * float(volume)))))
+            volume = self._mix_volume(volume)
             
             music = self.resources.get_music(name)
             Mix_PlayMusic(music, -1)
@@ -1997,6 +2508,9 @@ def __init__():
             '''
             self.ensure_init()
             
+            if not self._audio_ready:
+                return
+            
             Mix_HaltMusic()
             Mix_RewindMusic()
 
@@ -2006,7 +2520,6 @@ def __init__():
     
     # Clean-up the module's global name-space.
     del globals()['__init__']
-    del globals()['MicroPyApi']
 
 
 __init__()
@@ -21,44 +21,162 @@
 # CUBR changes:
 # 15/9/2021- added comments on potential changes
 
-from colorsys import hls_to_rgb
+from functools import lru_cache
 import re
 
 
+# Dispatches a normalised colour string on its syntax; the arguments of the
+# functional forms are then checked by the matching entry of _ARGUMENT_RES.
+_COLOR_RE = re.compile(r'''
+    \#(?P<hex>[0-9a-f]{3,4}|[0-9a-f]{6}|[0-9a-f]{8})
+  | rgb\((?P<rgb>[^)]*)\)
+  | rgba\((?P<rgba>[^)]*)\)
+  | hsl\((?P<hsl>[^)]*)\)
+  | hsla\((?P<hsla>[^)]*)\)''', re.X)
+
+_NUMBER  = r'(\d+\.\d+|\d+\.|\.\d+|\d+)'
+_PERCENT = r'(\d+\.\d+%|\d+\.%|\.\d+%|\d+%|0)'
+
+_ARGUMENT_RES = {
+    'rgb':  re.compile(r'\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*'),
+    'rgba': re.compile(r'\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*,\s*%s\s*' % _NUMBER),
+    'hsl':  re.compile(r'\s*%s\s*,\s*%s\s*,\s*%s\s*' % (_NUMBER, _PERCENT, _PERCENT)),
+    'hsla': re.compile(r'\s*%s\s*,\s*%s\s*,\s*%s\s*,\s*%s\s*' % (_NUMBER, _PERCENT, _PERCENT, _NUMBER)),
+}
+
+
+# Named colours, resolved once at import.
+_COLOR_TABLE = {
+    'aliceblue':            (240, 248, 255, 255), 'antiquewhite':         (250, 235, 215, 255),
+    'aqua':                 (  0, 255, 255, 255), 'aquamarine':           (127, 255, 212, 255),
+    'azure':                (240, 255, 255, 255), 'beige':                (245, 245, 220, 255),
+    'bisque':               (255, 228, 196, 255), 'black':                (  0,   0,   0, 255),
+    'blanchedalmond':       (255, 235, 205, 255), 'blue':                 (  0,   0, 255, 255),
+    'blueviolet':           (138,  43, 226, 255), 'brown':                (165,  42,  42, 255),
+    'burlywood':            (222, 184, 135, 255), 'cadetblue':            ( 95, 158, 160, 255),
+    'chartreuse':           (127, 255,   0, 255), 'chocolate':            (210, 105,  30, 255),
+    'coral':                (255, 127,  80, 255), 'cornflowerblue':       (100, 149, 237, 255),
+    'cornsilk':             (255, 248, 220, 255), 'crimson':              (220,  20,  60, 255),
+    'cyan':                 (  0, 255, 255, 255), 'darkblue':             (  0,   0, 139, 255),
+    'darkcyan':             (  0, 139, 139, 255), 'darkgoldenrod':        (184, 134,  11, 255),
+    'darkgray':             (169, 169, 169, 255), 'darkgreen':            (  0, 100,   0, 255),
+    'darkkhaki':            (189, 183, 107, 255), 'darkmagenta':          (139,   0, 139, 255),
+    'darkolivegreen':       ( 85, 107,  47, 255), 'darkorange':           (255, 140,   0, 255),
+    'darkorchid':           (153,  50, 204, 255), 'darkred':              (139,   0,   0, 255),
+    'darksalmon':           (233, 150, 122, 255), 'darkseagreen':         (143, 188, 143, 255),
+    'darkslateblue':        ( 72,  61, 139, 255), 'darkslategray':        ( 47,  79,  79, 255),
+    'darkturquoise':        (  0, 206, 209, 255), 'darkviolet':           (148,   0, 211, 255),
+    'deeppink':             (255,  20, 147, 255), 'deepskyblue':          (  0, 191, 255, 255),
+    'dimgray':              (105, 105, 105, 255), 'dodgerblue':           ( 30, 144, 255, 255),
+    'firebrick':            (178,  34,  34, 255), 'floralwhite':          (255, 250, 240, 255),
+    'forestgreen':          ( 34, 139,  34, 255), 'fuchsia':              (255,   0, 255, 255),
+    'gainsboro':            (220, 220, 220, 255), 'ghostwhite':           (248, 248, 255, 255),
+    'gold':                 (255, 215,   0, 255), 'goldenrod':            (218, 165,  32, 255),
+    'gray':                 (128, 128, 128, 255), 'green':                (  0, 128,   0, 255),
+    'greenyellow':          (173, 255,  47, 255), 'honeydew':             (240, 255, 240, 255),
+    'hotpink':              (255, 105, 180, 255), 'indianred':            (205,  92,  92, 255),
+    'indigo':               ( 75,   0, 130, 255), 'ivory':                (255, 255, 240, 255),
+    'khaki':                (240, 230, 140, 255), 'lavender':             (230, 230, 250, 255),
+    'lavenderblush':        (255, 240, 245, 255), 'lawngreen':            (124, 252,   0, 255),
+    'lemonchiffon':         (255, 250, 205, 255), 'lightblue':            (173, 216, 230, 255),
+    'lightcoral':           (240, 128, 128, 255), 'lightcyan':            (224, 255, 255, 255),
+    'lightgoldenrodyellow': (250, 250, 210, 255), 'lightgray':            (211, 211, 211, 255),
+    'lightgreen':           (144, 238, 144, 255), 'lightpink':            (255, 182, 193, 255),
+    'lightsalmon':          (255, 160, 122, 255), 'lightseagreen':        ( 32, 178, 170, 255),
+    'lightskyblue':         (135, 206, 250, 255), 'lightslategray':       (119, 136, 153, 255),
+    'lightsteelblue':       (176, 196, 222, 255), 'lightyellow':          (255, 255, 224, 255),
+    'lime':                 (  0, 255,   0, 255), 'limegreen':            ( 50, 205,  50, 255),
+    'linen':                (250, 240, 230, 255), 'magenta':              (255,   0, 255, 255),
+    'maroon':               (128,   0,   0, 255), 'mediumaquamarine':     (102, 205, 170, 255),
+    'mediumblue':           (  0,   0, 205, 255), 'mediumorchid':         (186,  85, 211, 255),
+    'mediumpurple':         (147, 112, 219, 255), 'mediumseagreen':       ( 60, 179, 113, 255),
+    'mediumslateblue':      (123, 104, 238, 255), 'mediumspringgreen':    (  0, 250, 154, 255),
+    'mediumturquoise':      ( 72, 209, 204, 255), 'mediumvioletred':      (199,  21, 133, 255),
+    'midnightblue':         ( 25,  25, 112, 255), 'mintcream':            (245, 255, 250, 255),
+    'mistyrose':            (255, 228, 225, 255), 'moccasin':             (255, 228, 181, 255),
+    'navajowhite':          (255, 222, 173, 255), 'navy':                 (  0,   0, 128, 255),
+    'oldlace':              (253, 245, 230, 255), 'olive':                (128, 128,   0, 255),
+    'olivedrab':            (107, 142,  35, 255), 'orange':               (255, 165,   0, 255),
+    'orangered':            (255,  69,   0, 255), 'orchid':               (218, 112, 214, 255),
+    'palegoldenrod':        (238, 232, 170, 255), 'palegreen':            (152, 251, 152, 255),
+    'paleturquoise':        (175, 238, 238, 255), 'palevioletred':        (219, 112, 147, 255),
+    'papayawhip':           (255, 239, 213, 255), 'peachpuff':            (255, 218, 185, 255),
+    'peru':                 (205, 133,  63, 255), 'pink':                 (255, 192, 203, 255),
+    'plum':                 (221, 160, 221, 255), 'powderblue':           (176, 224, 230, 255),
+    'purple':               (128,   0, 128, 255), 'red':                  (255,   0,   0, 255),
+    'rosybrown':            (188, 143, 143, 255), 'royalblue':            ( 65, 105, 225, 255),
+    'saddlebrown':          (139,  69,  19, 255), 'salmon':               (250, 128, 114, 255),
+    'sandybrown':           (244, 164,  96, 255), 'seagreen':             ( 46, 139,  87, 255),
+    'seashell':             (255, 245, 238, 255), 'sienna':               (160,  82,  45, 255),
+    'silver':               (192, 192, 192, 255), 'skyblue':              (135, 206, 235, 255),
+    'slateblue':            (106,  90, 205, 255), 'slategray':            (112, 128, 144, 255),
+    'snow':                 (255, 250, 250, 255), 'springgreen':          (  0, 255, 127, 255),
+    'steelblue':            ( 70, 130, 180, 255), 'tan':                  (210, 180, 140, 255),
+    'teal':                 (  0, 128, 128, 255), 'thistle':              (216, 191, 216, 255),
+    'tomato':               (255,  99,  71, 255), 'turquoise':            ( 64, 224, 208, 255),
+    'violet':               (238, 130, 238, 255), 'wheat':                (245, 222, 179, 255),
+    'white':                (255, 255, 255, 255), 'whitesmoke':           (245, 245, 245, 255),
+    'yellow':               (255, 255,   0, 255), 'yellowgreen':          (154, 205,  50, 255)
+}
+
+
 def rgba(r, g, b, a=1.0):
-    if r < 0 and r > 255:
+    if not 0 <= r <= 255:
         raise ValueError('red component of rgb/rgba color must be between 0 - 255')
-    if g < 0 and g > 255:
+    if not 0 <= g <= 255:
         raise ValueError('green component of rgb/rgba color must be between 0 - 255')
-    if b < 0 and b > 255:
+    if not 0 <= b <= 255:
         raise ValueError('blue component of rgb/rgba color must be between 0 - 255')
-    if a < 0 and a > 1:
+    if not 0 <= a <= 1:
         raise ValueError('alpha component of rgb/rgba color must be between 0.0 - 1.0')
     
     return r, g, b, int(a * 255)
 
 #potentially add mirror function to allow for hsv
 def hsla(h, s, l, a=1.0):
-    if h < 0 and h > 360:
+    if not 0 <= h <= 360:
         raise ValueError('hue component of hsl/hsla color must be between 0 - 360')
-    if s < 0 and s > 100:
+    if not 0 <= s <= 100:
         raise ValueError('saturation component of hsl/hsla color must be between 0% - 100%')
-    if l < 0 and l > 100:
+    if not 0 <= l <= 100:
         raise ValueError('lightness component of hsl/hsla color must be between 0% - 100%')
-    if a < 0 and a > 1:
+    if not 0 <= a <= 1:
         raise ValueError('alpha component of hsl/hsla color must be between 0.0 - 1.0')
     
     h /= 360.0
     s /= 100.0
     l /= 100.0
     
-    r, g, b = hls_to_rgb(h, l, s)
+    if s == 0.0:
+        grey = int(l * 255)
+        return grey, grey, grey, int(a * 255)
+    
+    # colorsys.hls_to_rgb(), inlined.
+    m2 = l * (1.0 + s) if l <= 0.5 else l + s - (l * s)
+    m1 = 2.0 * l - m2
     
-    return int(r * 255), int(g * 255), int(b * 255), int(a * 255)
+    return (int(_hue_channel(m1, m2, h + 1.0 / 3.0) * 255),
+            int(_hue_channel(m1, m2, h) * 255),
+            int(_hue_channel(m1, m2, h - 1.0 / 3.0) * 255),
+            int(a * 255))
+
+
+def _hue_channel(m1, m2, hue):
+    hue %= 1.0
+    if hue < 1.0 / 6.0:
+        return m1 + (m2 - m1) * hue * 6.0
+    if hue < 0.5:
+        return m2
+    if hue < 2.0 / 3.0:
+        return m1 + (m2 - m1) * (2.0 / 3.0 - hue) * 6.0
+    return m1
 
 
 #potentially add capability to add own named colours.
 #potnetially change spelling from color to colour, maybe find a way to use both
+# Colour strings are immutable and tend to be reused every frame, so parsed
+# results are memoised.
+@lru_cache(maxsize=512)
 def color_from_name(name):      
     if isinstance(name, str):
         key = name.lower().strip()
@@ -66,140 +184,63 @@ def color_from_name(name):
         try:
             if key == '':
                 return 0, 0, 0, 0
-            elif key[0] == '#' and len(key) == 4:
-                return (int(name[1] * 2, 16),
-                        int(name[2] * 2, 16),
-                        int(name[3] * 2, 16),
-                        255)
-            elif key[0] == '#' and len(key) == 5:
-                return (int(name[1] * 2, 16),
-                        int(name[2] * 2, 16),
-                        int(name[3] * 2, 16),
-                        int(name[4] * 2, 16))
-            elif key[0] == '#' and len(key) == 7:
-                return (int(name[1:3], 16),
-                        int(name[3:5], 16),
-                        int(name[3:7], 16),
-                        255)
-            elif key[0] == '#' and len(key) == 9:
-                return (int(name[1:3], 16),
-                        int(name[3:5], 16),
-                        int(name[5:7], 16),
-                        int(name[7:9], 16))
-            else:
-                match = re.match(r'''rgb\(
-                    \s*(\d+)\s*,
-                    \s*(\d+)\s*,
-                    \s*(\d+)\s*\)''', name, re.X)
-                if match:
-                    return rgba(int(match.group(1)), 
-                                int(match.group(2)), 
-                                int(match.group(3)))
-                match = re.match(r'''rgba\(
-                    \s*(\d+)\s*,
-                    \s*(\d+)\s*,
-                    \s*(\d+)\s*,
-                    \s*(\d+\.\d+|\d+\.|\.\d+|\d+)\s*\)''', name, re.X)
-                if match:
-                    return rgba(int(match.group(1)), 
-                                int(match.group(2)), 
-                                int(match.group(3)), 
-                                float(match.group(4)))
-                match = re.match(r'''hsl\(
-                    \s*(\d+\.\d+|\d+\.|\.\d+|\d+)\s*,
-                    \s*(\d+\.\d+%|\d+\.%|\.\d+%|\d+%|0)\s*,
-                    \s*(\d+\.\d+%|\d+\.%|\.\d+%|\d+%|0)\s*\)''', name, re.X)
-                if match:
-                    return hsla(float(match.group(1)), 
-                                float(match.group(2).rstrip('%')), 
-                                float(match.group(3).rstrip('%')))
-                match = re.match(r'''hsla\(\s*
-                    (\d+\.\d+|\d+\.|\.\d+|\d+)
-                    \s*,\s*
-                    (\d+\.\d+%|\d+\.%|\.\d+%|\d+%|0)
-                    \s*,\s*
-                    (\d+\.\d+%|\d+\.%|\.\d+%|\d+%|0)
-                    \s*,\s*
-                    (\d+\.\d+|\d+\.|\.\d+|\d+)
-                    \s*\)''', name, re.X)
-                if match:
-                    return hsla(float(match.group(1)), 
-                                float(match.group(2).rstrip('%')), 
-                                float(match.group(3).rstrip('%')), 
-                                float(match.group(4)))
+            
+            named = _COLOR_TABLE.get(key)
+            if named is not None:
+                return named
+            
+            match = _COLOR_RE.fullmatch(key)
+            if match:
+                kind = match.lastgroup
+                if kind == 'hex':
+                    digits = match.group('hex')
+                    value  = int(digits, 16)
+                    if len(digits) == 3:
+                        return ((value >> 8 & 0xf) * 0x11,
+                                (value >> 4 & 0xf) * 0x11,
+                                (value      & 0xf) * 0x11,
+                                255)
+                    elif len(digits) == 4:
+                        return ((value >> 12 & 0xf) * 0x11,
+                                (value >>  8 & 0xf) * 0x11,
+                                (value >>  4 & 0xf) * 0x11,
+                                (value       & 0xf) * 0x11)
+                    elif len(digits) == 6:
+                        return (value >> 16 & 0xff,
+                                value >>  8 & 0xff,
+                                value       & 0xff,
+                                255)
+                    else:
+                        return (value >> 24 & 0xff,
+                                value >> 16 & 0xff,
+                                value >>  8 & 0xff,
+                                value       & 0xff)
+                
+                args = _ARGUMENT_RES[kind].fullmatch(match.group(kind))
+                if args is None:
+                    raise ValueError(name)
                 
-                if not match:
-                    return {'aliceblue':            (240, 248, 255), 'antiquewhite':         (250, 235, 215),
-                            'aqua':                 (  0, 255, 255), 'aquamarine':           (127, 255, 212),
-                            'azure':                (240, 255, 255), 'beige':                (245, 245, 220),
-                            'bisque':               (255, 228, 196), 'black':                (  0,   0,   0),
-                            'blanchedalmond':       (255, 235, 205), 'blue':                 (  0,   0, 255),
-                            'blueviolet':           (138,  43, 226), 'brown':                (165,  42,  42),
-                            'burlywood':            (222, 184, 135), 'cadetblue':            ( 95, 158, 160),
-                            'chartreuse':           (127, 255,   0), 'chocolate':            (210, 105,  30),
-                            'coral':                (255, 127,  80), 'cornflowerblue':       (100, 149, 237),
-                            'cornsilk':             (255, 248, 220), 'crimson':              (220,  20,  60),
-                            'cyan':                 (  0, 255, 255), 'darkblue':             (  0,   0, 139),
-                            'darkcyan':             (  0, 139, 139), 'darkgoldenrod':        (184, 134,  11),
-                            'darkgray':             (169, 169, 169), 'darkgreen':            (  0, 100,   0),
-                            'darkkhaki':            (189, 183, 107), 'darkmagenta':          (139,   0, 139),
-                            'darkolivegreen':       ( 85, 107,  47), 'darkorange':           (255, 140,   0),
-                            'darkorchid':           (153,  50, 204), 'darkred':              (139,   0,   0),
-                            'darksalmon':           (233, 150, 122), 'darkseagreen':         (143, 188, 143),
-                            'darkslateblue':        ( 72,  61, 139), 'darkslategray':        ( 47,  79,  79),
-                            'darkturquoise':        (  0, 206, 209), 'darkviolet':           (148,   0, 211),
-                            'deeppink':             (255,  20, 147), 'deepskyblue':          (  0, 191, 255),
-                            'dimgray':              (105, 105, 105), 'dodgerblue':           ( 30, 144, 255),
-                            'firebrick':            (178,  34,  34), 'floralwhite':          (255, 250, 240),
-                            'forestgreen':          ( 34, 139,  34), 'fuchsia':              (255,   0, 255),
-                            'gainsboro':            (220, 220, 220), 'ghostwhite':           (248, 248, 255),
-                            'gold':                 (255, 215,   0), 'goldenrod':            (218, 165,  32),
-                            'gray':                 (128, 128, 128), 'green':                (  0, 128,   0),
-                            'greenyellow':          (173, 255,  47), 'honeydew':             (240, 255, 240),
-                            'hotpink':              (255, 105, 180), 'indianred':            (205,  92,  92),
-                            'indigo':               ( 75,   0, 130), 'ivory':                (255, 255, 240),
-                            'khaki':                (240, 230, 140), 'lavender':             (230, 230, 250),
-                            'lavenderblush':        (255, 240, 245), 'lawngreen':            (124, 252,   0),
-                            'lemonchiffon':         (255, 250, 205), 'lightblue':            (173, 216, 230),
-                            'lightcoral':           (240, 128, 128), 'lightcyan':            (224, 255, 255),
-                            'lightgoldenrodyellow': (250, 250, 210), 'lightgray':            (211, 211, 211),
-                            'lightgreen':           (144, 238, 144), 'lightpink':            (255, 182, 193),
-                            'lightsalmon':          (255, 160, 122), 'lightseagreen':        ( 32, 178, 170),
-                            'lightskyblue':         (135, 206, 250), 'lightslategray':       (119, 136, 153),
-                            'lightsteelblue':       (176, 196, 222), 'lightyellow':          (255, 255, 224),
-                            'lime':                 (  0, 255,   0), 'limegreen':            ( 50, 205,  50),
-                            'linen':                (250, 240, 230), 'magenta':              (255,   0, 255),
-                            'maroon':               (128,   0,   0), 'mediumaquamarine':     (102, 205, 170),
-                            'mediumblue':           (  0,   0, 205), 'mediumorchid':         (186,  85, 211),
-                            'mediumpurple':         (147, 112, 219), 'mediumseagreen':       ( 60, 179, 113),
-                            'mediumslateblue':      (123, 104, 238), 'mediumspringgreen':    (  0, 250, 154),
-                            'mediumturquoise':      ( 72, 209, 204), 'mediumvioletred':      (199,  21, 133),
-                            'midnightblue':         ( 25,  25, 112), 'mintcream':            (245, 255, 250),
-                            'mistyrose':            (255, 228, 225), 'moccasin':             (255, 228, 181),
-                            'navajowhite':          (255, 222, 173), 'navy':                 (  0,   0, 128),
-                            'oldlace':              (253, 245, 230), 'olive':                (128, 128,   0),
-                            'olivedrab':            (107, 142,  35), 'orange':               (255, 165,   0),
-                            'orangered':            (255,  69,   0), 'orchid':               (218, 112, 214),
-                            'palegoldenrod':        (238, 232, 170), 'palegreen':            (152, 251, 152),
-                            'paleturquoise':        (175, 238, 238), 'palevioletred':        (219, 112, 147),
-                            'papayawhip':           (255, 239, 213), 'peachpuff':            (255, 218, 185),
-                            'peru':                 (205, 133,  63), 'pink':                 (255, 192, 203),
-                            'plum':                 (221, 160, 221), 'powderblue':           (176, 224, 230),
-                            'purple':               (128,   0, 128), 'red':                  (255,   0,   0),
-                            'rosybrown':            (188, 143, 143), 'royalblue':            ( 65, 105, 225),
-                            'saddlebrown':          (139,  69,  19), 'salmon':               (250, 128, 114),
-                            'sandybrown':           (244, 164,  96), 'seagreen':             ( 46, 139,  87),
-                            'seashell':             (255, 245, 238), 'sienna':               (160,  82,  45),
-                            'silver':               (192, 192, 192), 'skyblue':              (135, 206, 235),
-                            'slateblue':            (106,  90, 205), 'slategray':            (112, 128, 144),
-                            'snow':                 (255, 250, 250), 'springgreen':          (  0, 255, 127),
-                            'steelblue':            ( 70, 130, 180), 'tan':                  (210, 180, 140),
-                            'teal':                 (  0, 128, 128), 'thistle':              (216, 191, 216),
-                            'tomato':               (255,  99,  71), 'turquoise':            ( 64, 224, 208),
-                            'violet':               (238, 130, 238), 'wheat':                (245, 222, 179),
-                            'white':                (255, 255, 255), 'whitesmoke':           (245, 245, 245),
-                            'yellow':               (255, 255,   0), 'yellowgreen':          (154, 205,  50)}[key] + (255,)
-        except (KeyError, ValueError):
+                if kind == 'rgb':
+                    return rgba(int(args.group(1)), 
+                                int(args.group(2)), 
+                                int(args.group(3)))
+                elif kind == 'rgba':
+                    return rgba(int(args.group(1)), 
+                                int(args.group(2)), 
+                                int(args.group(3)), 
+                                float(args.group(4)))
+                elif kind == 'hsl':
+                    return hsla(float(args.group(1)), 
+                                float(args.group(2).rstrip('%')), 
+                                float(args.group(3).rstrip('%')))
+                else:
+                    return hsla(float(args.group(1)), 
+                                float(args.group(2).rstrip('%')), 
+                                float(args.group(3).rstrip('%')), 
+                                float(args.group(4)))
+            
+            raise ValueError(name)
+        except ValueError:
             raise ValueError('Invalid color %r' % name)
     else:
         raise TypeError('color values must be strings')
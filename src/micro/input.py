@@ -22,18 +22,67 @@
 # 15/9/2021- added comments on potential changes
 
 from   ctypes import c_int, byref, addressof
+from   functools import partial
 import re
 
 from .sdl2 import *
 
+
+_KEY_NAME_RE = re.compile(r'\s|\\|\.|,|/|\#|\'|;|\[|\]|`|\-|\=|\+|\*')
+_KEY_NAME_SUBSTITUTIONS = {
+    ' ':  '_',             '\\': 'backslash',
+    '.':  'period',        ',':  'comma',
+    '/':  'slash',         '#':  'hash',
+    "'":  'quote',         ';':  'semicolon',
+    '[':  'open_bracket',  ']':  'close_bracket',
+    '=':  'equals',        '-':  'minus',
+    '+':  'plus',          '*':  'asterisk',
+    '`':  'backtick',
+}
+
+# Key names only depend on the key code, so each is only worked out once.
+_KEY_NAME_CACHE = {}
+
+_MOUSE_BUTTON_MASKS = (('left', 0x1), ('middle', 0x2), ('right', 0x4))
+
+# Scales raw axis values into -1.0 - 1.0, indexed by `value > 0`.
+_AXIS_SCALE = (1.0 / 32768.0, 1.0 / 32767.0)
+
+
+def update_joystick_state(raw_buttons, raw_axes, buttons, axis, daxis, axis_sign):
+    # `raw_buttons` and `raw_axes` can be any iterable, each is read once.
+    # Counters are bumped while held and reset on release, multiplying by
+    # the pressed state avoids branching per button/axis.  All output lists
+    # are updated in place.
+    buttons[:] = [(count + 1) * bool(state) 
+                  for count, state in zip(buttons, raw_buttons)]
+    
+    axis[:] = [value * _AXIS_SCALE[value > 0] * sign + 0.0 
+               for value, sign in zip(raw_axes, axis_sign)]
+    
+    daxis[0::2] = [(count + 1) * (value < -0.333) 
+                   for count, value in zip(daxis[0::2], axis)]
+    daxis[1::2] = [(count + 1) * (value >  0.333) 
+                   for count, value in zip(daxis[1::2], axis)]
+
+
 #potentially rename to gamepad or controller
 #potentially allow for buttons, axes, and the controller itself to have a name
 class Joystick:
     def __init__(self, sdl_joystick):
         self.sdl_joystick = sdl_joystick
-        self.buttons = [0] * SDL_JoystickNumButtons(sdl_joystick)
-        self.axis = [0.0] * SDL_JoystickNumAxes(sdl_joystick)
-        self.daxis = [0] * (SDL_JoystickNumAxes(sdl_joystick) * 2)
+        self.button_ids = range(SDL_JoystickNumButtons(sdl_joystick))
+        self.axis_ids   = range(SDL_JoystickNumAxes(sdl_joystick))
+        self.get_button = partial(SDL_JoystickGetButton, sdl_joystick)
+        self.get_axis   = partial(SDL_JoystickGetAxis, sdl_joystick)
+        self.buttons = [0] * len(self.button_ids)
+        self.axis = [0.0] * len(self.axis_ids)
+        self.daxis = [0] * (len(self.axis_ids) * 2)
+        
+        # The y axis (axis 1) is flipped so that up is positive.
+        self.axis_sign = [1.0] * len(self.axis_ids)
+        if len(self.axis_sign) > 1:
+            self.axis_sign[1] = -1.0
         
     
     def dispose(self):
@@ -41,65 +90,61 @@ class Joystick:
     
     
     def update(self):
-        joystick = self.sdl_joystick
-        
-        for button in range(SDL_JoystickNumButtons(joystick)):
-            state = SDL_JoystickGetButton(joystick, button)
-            if state:
-                self.buttons[button] += 1
-            else:
-                self.buttons[button]  = 0
-        
-        
-        for axis in range(SDL_JoystickNumAxes(joystick)):
-            value = SDL_JoystickGetAxis(joystick, axis)
-            if value > 0:
-                value /= 32767.0
-            else:   
-                value /= 32768.0
-            
-            if axis == 1: 
-                value = -value
-                if value == 0: value = 0.0
-            
-            if value < -0.333:
-                self.daxis[axis * 2 + 0] += 1
-            else:
-                self.daxis[axis * 2 + 0]  = 0
-                
-            if value >  0.333:
-                self.daxis[axis * 2 + 1] += 1
-            else:
-                self.daxis[axis * 2 + 1]  = 0
-            
-            self.axis[axis] = value
+        update_joystick_state(
+            map(self.get_button, self.button_ids),
+            map(self.get_axis, self.axis_ids),
+            self.buttons, self.axis, self.daxis, self.axis_sign)
                 
 
 class InputHandler:
+    EVENT_BATCH = 128
+    
+    _event_buffer = (SDL_Event * EVENT_BATCH)()
+    
     def __init__(self, api):
         self.api = api
     
-        self.keys = {}
+        # Key counters are indexed by scancode, `keys` maps the scancodes of
+        # held keys to their names and `key_scancodes` maps names seen so far
+        # back to their scancode.
+        self.key_counts    = [0] * SDL_NUM_SCANCODES
+        self.keys          = {}
+        self.key_scancodes = {}
         self.joysticks = {}
         
+        self._handlers = {
+            SDL_KEYDOWN: self._on_keydown,
+            SDL_KEYUP:   self._on_keyup,
+        }
+        
         self.mouse = (0, 0)
         self.mouse_prev = None
         self.mouse_rel  = (0, 0)
         self.mouse_buttons = {'left': 0, 'middle': 0, 'right': 0}
         
+        # Out parameters for the mouse position query, reused every frame.
+        self._mouse_x  = c_int()
+        self._mouse_y  = c_int()
+        self._mouse_x_ref = byref(self._mouse_x)
+        self._mouse_y_ref = byref(self._mouse_y)
+        
+        self._mouse_xform_key = None
+        self._mouse_xform     = None
+        
         SDL_JoystickUpdate()
         
         self.default_joystick = None
+        name_counts = {}
         for i in range(SDL_NumJoysticks()):
             sdl_joystick = SDL_JoystickOpen(i)
             if sdl_joystick:
                 base_name = '_'.join(re.sub(r'[^0-9a-z]', '', SDL_JoystickName(sdl_joystick).decode().lower()).split())
-                candidate = base_name
-                index = 2
-                while candidate in self.joysticks:
-                    candidate = '%s%d' % (base_name, index)
+                index = name_counts.get(base_name, 1)
+                name  = base_name if index == 1 else '%s%d' % (base_name, index)
+                while name in self.joysticks:
                     index += 1
-                name = candidate
+                    name = '%s%d' % (base_name, index)
+                name_counts[base_name] = index + 1
                 
                 joystick = Joystick(sdl_joystick)
                 self.joysticks[name] = joystick
@@ -174,7 +219,11 @@ class InputHandler:
     
     
     def key(self, key_name):
-        return self.keys.get(str(key_name).strip().lower(), 0)
+        scancode = self.key_scancodes.get(str(key_name).strip().lower())
+        if scancode is None:
+            return 0
+        
+        return self.key_counts[scancode]
     
     
     def dispose(self):
@@ -187,67 +236,73 @@ class InputHandler:
     #potentially find a way to have a way to switch between uk and us spellings
     @staticmethod
     def key_name(id):
+        name = _KEY_NAME_CACHE.get(id)
+        if name is not None:
+            return name
+        
         name = SDL_GetKeyName(id).decode().lower()
-        name = re.sub(r'\s|\\|\.|,|/|\#|\'|;|\[|\]|`|\-|\=|\+|\*', 
-            lambda match: {
-                ' ':  '_',             '\\': 'backslash',
-                '.':  'period',        ',':  'comma',
-                '/':  'slash',         '#':  'hash',
-                "'":  'quote',         ';':  'semicolon',
-                '[':  'open_bracket',  ']':  'close_bracket',
-                '=':  'equals',        '-':  'minus',
-                '+':  'plus',          '*':  'asterisk',
-                '`':  'backtick',
-            }[match.group(0)], name)
+        name = _KEY_NAME_RE.sub(lambda match: _KEY_NAME_SUBSTITUTIONS[match.group(0)], name)
         
+        _KEY_NAME_CACHE[id] = name
         return name
     
-        
+    
+    def pump(self):
+        # SDL_PollEvent pumps the event loop on every call, instead pump once
+        # and drain the queue a batch at a time.
+        SDL_PumpEvents()
+        
+        buffer = self._event_buffer
+        while True:
+            count = SDL_PeepEvents(buffer, self.EVENT_BATCH, SDL_GETEVENT, 
+                                   SDL_FIRSTEVENT, SDL_LASTEVENT)
+            if count <= 0:
+                break
+            
+            for index in range(count):
+                yield buffer[index]
+            
+            if count < self.EVENT_BATCH:
+                break
+    
+    
     def update(self):
-        for key in self.keys:
-            self.keys[key] += 1
+        key_counts = self.key_counts
+        for scancode in self.keys:
+            key_counts[scancode] += 1
             
         for joystick in self.joysticks.values():
             joystick.update()
         
-        x = c_int()
-        y = c_int()
-        button_bits = SDL_GetMouseState(byref(x), byref(y))
-        x = x.value
-        y = y.value
-        
-        if button_bits & 0x1:
-            self.mouse_buttons['left'] += 1
-        else:
-            self.mouse_buttons['left'] = 0
-        
-        if button_bits & 0x2:
-            self.mouse_buttons['middle'] += 1
-        else:
-            self.mouse_buttons['middle'] = 0
-        
-        if button_bits & 0x4:
-            self.mouse_buttons['right'] += 1
-        else:
-            self.mouse_buttons['right'] = 0
-        
-        w = c_int()
-        h = c_int()
-        SDL_GetWindowSize(self.api.window, byref(w), byref(h))
-        w = w.value
-        h = h.value
-        
-        scale    = min(w / self.api.width, h / self.api.height)
-        width    = int(self.api.width * scale)
-        height   = int(self.api.height * scale)
-        corner_x = (w - width) // 2
-        corner_y = (h - height) // 2
+        button_bits = SDL_GetMouseState(self._mouse_x_ref, self._mouse_y_ref)
+        x = self._mouse_x.value
+        y = self._mouse_y.value
+        
+        mouse_buttons = self.mouse_buttons
+        for name, mask in _MOUSE_BUTTON_MASKS:
+            mouse_buttons[name] = (mouse_buttons[name] + 1) * bool(button_bits & mask)
+        
+        w = self.api._window_w
+        h = self.api._window_h
+        
+        # The window to screen transform only changes when the window is
+        # resized or the resolution changes.
+        xform_key = (w, h, self.api.width, self.api.height)
+        if xform_key != self._mouse_xform_key:
+            scale    = min(w / self.api.width, h / self.api.height)
+            width    = int(self.api.width * scale)
+            height   = int(self.api.height * scale)
+            corner_x = (w - width) // 2
+            corner_y = (h - height) // 2
+            
+            self._mouse_xform = (corner_x, corner_y, 1.0 / scale if scale else 0.0,
+                                 self.api.width // 2, self.api.height // 2)
+            self._mouse_xform_key = xform_key
         
-        x = int((x - corner_x) / scale) 
-        y = int((y - corner_y) / scale) 
+        corner_x, corner_y, inv_scale, half_w, half_h = self._mouse_xform
         
-        x -= self.api.width // 2
-        y  = self.api.height // 2 - y
+        x = int((x - corner_x) * inv_scale) - half_w
+        y = half_h - int((y - corner_y) * inv_scale)
         
         self.mouse = (x, y)
         
@@ -261,8 +316,25 @@ class InputHandler:
         
         
     def process(self, event):
-        if event.type == SDL_KEYDOWN:
-            if not event.key.repeat:
-                self.keys[self.key_name(event.key.keysym.sym)] = 1
-        elif event.type == SDL_KEYUP:
-            del self.keys[self.key_name(event.key.keysym.sym)]
+        handler = self._handlers.get(event.type)
+        if handler:
+            handler(event)
+    
+    
+    def _on_keydown(self, event):
+        key = event.key
+        if not key.repeat:
+            keysym   = key.keysym
+            scancode = keysym.scancode
+            name     = self.key_name(keysym.sym)
+            
+            self.key_counts[scancode] = 1
+            self.keys[scancode] = name
+            self.key_scancodes[name] = scancode
+    
+    
+    def _on_keyup(self, event):
+        scancode = event.key.keysym.scancode
+        
+        self.key_counts[scancode] = 0
+        self.keys.pop(scancode, None)
@@ -18,7 +18,9 @@
 #    misrepresented as being the original software.
 # 3. This notice may not be removed or altered from any source distribution.
 
+from   array import array
 from   base64 import b64decode
+from   bisect import bisect_left
 from   configparser import ConfigParser, NoOptionError, NoSectionError
 import re, os
 
@@ -35,6 +37,15 @@ AUDIO_EXTS = ['aif', 'aiff', 'flac', 'mp3', 'ogg', 'wav']
 IMAGE_EXTS = ['bmp', 'gif', 'jpg', 'jpeg', 'png', 'tga', 'tif', 'tiff']
 
 
+_RESOURCE_NAME_RE  = re.compile(r'[a-z][0-9a-z]*')
+_ANIMATION_NAME_RE = re.compile(r'[a-z][0-9a-z]+')
+_DIRECTIVE_RE      = re.compile(r'[:=]')
+_TILE_RE           = re.compile(r'\d+|[a-z][a-z0-9]*(\*\d+)?')
+_TILE_REPEAT_RE    = re.compile(r'(.*?)\*(\d+)')
+
+_STRIP_WHITESPACE  = str.maketrans('', '', ' \t\r\n\v\f')
+
+
 INTERNAL_IMAGES = {
     '.white': {
         'image_b64': '''R0lGODlhAQABAIAAAP7//wAAACH5BAAAAAAALAAAAAAB
@@ -42,14 +53,42 @@ INTERNAL_IMAGES = {
     }
 }
 
+for internal_image in INTERNAL_IMAGES.values():
+    internal_image['image_bytes'] = b64decode(re.sub(r'\s', '', internal_image['image_b64']))
+del internal_image
+
+
+# Directory listings used by find_resource, keyed by directory and rebuilt
+# whenever the directory's modification time changes.
+_DIR_INDEX = {}
 
-def find_resource(name, types, roots):
-    rule = re.compile('%s.(%s)' % (name, '|'.join(types)), re.I)
 
+def index_directory(root):
+    mtime  = os.stat(root).st_mtime_ns
+    cached = _DIR_INDEX.get(root)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    index = {}
+    with os.scandir(root) as entries:
+        for entry in entries:
+            stem, dot, ext = entry.name.lower().rpartition('.')
+            if dot and entry.is_file():
+                index.setdefault(stem, {}).setdefault(ext, entry.path)
+    
+    _DIR_INDEX[root] = (mtime, index)
+    return index
+
+
+def find_resource(name, types, roots):
+    name = name.lower()
+    
     for root in roots:
-        for candidate in os.listdir(root):
-            if rule.match(candidate):
-                return os.path.join(root, candidate)
+        candidates = index_directory(root).get(name)
+        if candidates:
+            for type in types:
+                if type in candidates:
+                    return candidates[type]
 
 
 def load_tile_desc(width, height, filename):
@@ -83,7 +122,7 @@ def load_tile_desc(width, height, filename):
         key = name.lower().strip()
         
         if key != '.meta':
-            if not re.match(r'[a-z][0-9a-z]+', key):
+            if not _ANIMATION_NAME_RE.match(key):
                 raise IOError('invalid animation name %r, in file %r' % (name, filename))
             
             try:
@@ -95,18 +134,13 @@ def load_tile_desc(width, height, filename):
             if loop not in ('none', 'loop'):
                 raise IOError('invalid loop setting for animation %r, in file %r' % (name, filename))
             
-            frames = []
-            frames_str = str(config[name].get('frames')).split(',')
-            for frame in frames_str:
-                try:
-                    frame = int(frame.strip())
-                except ValueError:
-                    frame = -1
-                
-                if frame < 0:
-                    raise IOError('invalid frame index for animation %r, in file %r' % (name, filename))
-                
-                frames.append(frame)
+            try:
+                frames = array('i', map(int, str(config[name].get('frames')).split(',')))
+            except (ValueError, OverflowError):
+                frames = array('i', [-1])
+            
+            if frames and min(frames) < 0:
+                raise IOError('invalid frame index for animation %r, in file %r' % (name, filename))
             
             if not frames:
                 raise IOError('invalid frame sequence for animation %r, in file %r' % (name, filename))
@@ -165,17 +199,21 @@ class AbstractResourceManager:
     
     def get(self, name, *more_key, internal=False):
         name = name.strip()
-        key  = name.lower()
+        id   = name.lower()
+        key  = (id,) + more_key
+        
+        # Internal resources are cached alongside public ones, so only a 
+        # public lookup of a '.'-prefixed (internal-only) name has to be 
+        # validated before a cache hit is returned.
+        if internal or not id.startswith('.'):
+            resource = self.cache.get(key)
+            if resource is not None:
+                return resource
         
-        if not internal and not re.match(r'[a-z][0-9a-z]*', key):
+        if not internal and not _RESOURCE_NAME_RE.match(id):
             raise ValueError('invalid %s name %r' % (self.resource_type, name))
         
-        id  = key
-        key = (key,) + more_key
-        
-        if key in self.cache:
-            return self.cache[key]
-        elif internal:
+        if internal:
             if self.trace: log('loading internal resource %r' % repr(key))
             resource = self.load_internal_resource(key)
            
@@ -183,7 +221,7 @@ class AbstractResourceManager:
                 self.cache[key] = resource
                 return resource
             else:
-                raise IOError('failed to load %s named %r' % (self.reosurce_type, name))
+                raise IOError('failed to load %s named %r' % (self.resource_type, name))
         else:
             filename = find_resource(id, self.file_types, self.api.resources_dirs)
             meta_filename = None
@@ -197,7 +235,7 @@ class AbstractResourceManager:
                     self.cache[key] = resource
                     return resource
                 else:
-                    raise IOError('failed to load %s named %r' % (self.reosurce_type, name))
+                    raise IOError('failed to load %s named %r' % (self.resource_type, name))
         
         raise KeyError('no %s named %r' % (self.resource_type, name))
     
@@ -230,10 +268,9 @@ class ImageManager(AbstractResourceManager):
         
     
     def load_internal_resource(self, key):
-        image     = INTERNAL_IMAGES[key[0]].get('image_b64')
+        buffer    = INTERNAL_IMAGES[key[0]]['image_bytes']
         tile_desc = INTERNAL_IMAGES[key[0]].get('tile_desc', {})
-        
-        buffer  = b64decode(image.encode())
+
         rwops   = SDL_RWFromConstMem(buffer, len(buffer))
         surface = IMG_Load_RW(rwops, 1)
         if not surface:
@@ -315,17 +352,22 @@ class TileMapManager(AbstractResourceManager):
         with open(filename, 'r') as f:
             for line in f:
                 original_line = line.rstrip('\n')
-                line = ''.join(re.sub(r'[#;].*', '', line.lower()).split())
+                line = line.lower()
+                for marker in '#;':
+                    cut = line.find(marker)
+                    if cut != -1:
+                        line = line[:cut]
+                line = line.translate(_STRIP_WHITESPACE)
                 if line:
                     if tiles_read:
                         row = []
                         for tile in line.split(','):
-                            if tile and not re.match(r'\d+|[a-z][a-z0-9]*(\*\d+)?', tile):
+                            if tile and not _TILE_RE.match(tile):
                                 raise IOError('Invalid tile description %r, in %r' % (tile, filename))
                             
                             if not tile: tile = '0'
                             
-                            match = re.match(r'(.*?)\*(\d+)', tile)
+                            match = _TILE_REPEAT_RE.match(tile)
                             if match:
                                 tile  = match.group(1)
                                 count = int(match.group(2))
@@ -339,7 +381,7 @@ class TileMapManager(AbstractResourceManager):
                         rows.append(row)
                     else:
                         if line[:6] in ('tiles:', 'tiles='):
-                            tileset = re.split(r'[:=]', line, 1)[1]
+                            tileset = _DIRECTIVE_RE.split(line, 1)[1]
                             self.api.resources.get_image(tileset)
                             tiles_read = True
                         else:
@@ -351,23 +393,32 @@ class TileMapManager(AbstractResourceManager):
         
 class ResourceManager:
     def __init__(self, api):
+        self.api      = api
         self.fonts    = FontManager(api)
         self.images   = ImageManager(api)
         self.sounds   = SoundManager(api)
         self.music    = MusicManager(api)
         self.tilemaps = TileMapManager(api)
+        
+        # Index the resource directories up front so the first lookup of each
+        # resource doesn't pay for the directory scan mid-frame.
+        for root in api.resources_dirs:
+            index_directory(root)
     
     
     def get_font(self, font, size):
+        self.api.ensure_ttf()
         return self.fonts.get(font, size)
     
     def get_image(self, image, internal=False):
         return self.images.get(image, internal=internal)
     
     def get_sound(self, sound):
+        self.api.ensure_audio()
         return self.sounds.get(sound)
     
     def get_music(self, music):
+        self.api.ensure_audio()
         return self.music.get(music)
     
     def get_tilemap(self, tilemap):
@@ -387,13 +438,15 @@ class Animation:
         self.rate   = rate
         self.loop   = loop
         self.frames = frames
+        
+        self.is_static = len(set(frames)) == 1 or rate == 0
     
     
     def get_frame(self, time=0.0):
         index = int(time * self.rate)
         
         if self.loop == 'none':
-            index = min(index, len(self.frames))
+            index = min(index, len(self.frames) - 1)
         elif self.loop == 'loop':
             index = index % len(self.frames)
         
@@ -416,40 +469,75 @@ class Image:
         self.tile_spacing = tile_desc.get('tile_spacing', 0)
 
         self.animations = tile_desc.get('animations', {})
+        
+        # Source rectangles by frame, and animations by the name they were 
+        # requested with.
+        self.frame_rects      = {}
+        self.animation_lookup = {}
 
 
+    def get_frame_rect(self, frame):
+        if frame == 0:
+            return SDL_Rect(0, 0, self.width, self.height)
+        else:
+            frame -= 1
+            
+            margin = self.tile_margin
+            tile_w = self.tile_width
+            tile_h = self.tile_height
+            cell_w = tile_w + self.tile_spacing
+            cell_h = tile_h + self.tile_spacing
+            cols   = (self.width - margin * 2) // tile_w
+            
+            rect = SDL_Rect()
+            rect.x = margin + (frame  % cols) * cell_w
+            rect.y = margin + (frame // cols) * cell_h
+            rect.w = tile_w
+            rect.h = tile_h
+            
+            return rect
+    
+    
     def get_source_rect(self, animation, time=0.0):
+        # The rectangles returned are shared between calls and must not be 
+        # modified.
+        rect = self.frame_rects.get(animation)
+        if rect is not None:
+            return rect
+        
+        anim = self.animation_lookup.get(animation)
+        if anim is not None:
+            return self.get_source_rect(anim.get_frame(time))
+        
         try:
             frame = int(animation)
-            if frame == 0:
-                return SDL_Rect(0, 0, self.width, self.height)
-            else:
-                frame -= 1
-                
-                margin = self.tile_margin
-                tile_w = self.tile_width
-                tile_h = self.tile_height
-                cell_w = tile_w + self.tile_spacing
-                cell_h = tile_h + self.tile_spacing
-                cols   = (self.width - margin * 2) // tile_w
-                
-                rect = SDL_Rect()
-                rect.x = margin + (frame  % cols) * cell_w
-                rect.y = margin + (frame // cols) * cell_h
-                rect.w = tile_w
-                rect.h = tile_h
-                
-                return rect
         except ValueError:
-            animation = animation.strip()
-            key = animation.lower()
-            if not re.match(r'[a-z][0-9a-z]+', key):
-                raise ValueError('invalid animation name %r' % animation)
+            name = animation.strip()
+            key  = name.lower()
+            if not _ANIMATION_NAME_RE.match(key):
+                raise ValueError('invalid animation name %r' % name)
             
             try:
-                return self.get_source_rect(self.animations[key].get_frame(time))
+                anim = self.animations[key]
             except KeyError:
-                raise KeyError('no animation called %r' % animation)
+                raise KeyError('no animation called %r' % name)
+            
+            # Animations that never change frame are cached like plain frames,
+            # so they skip the time lookup from then on.
+            rect = self.get_source_rect(anim.get_frame(time))
+            if anim.is_static:
+                self.frame_rects[animation] = rect
+            else:
+                self.animation_lookup[animation] = anim
+            
+            return rect
+        
+        rect = self.frame_rects.get(frame)
+        if rect is None:
+            rect = self.frame_rects[frame] = self.get_frame_rect(frame)
+        
+        self.frame_rects[animation] = rect
+        return rect
         
 
     def dispose(self):
@@ -462,16 +550,39 @@ class TileMap:
         self.tileset = tileset
         self.width   = width
         self.height  = height
-        self.rows    = rows
+        
+        # Tiles are interned as small integer ids and stored row by row in a
+        # single flat array, id 0 being the transparent tile '0'.
+        self.id_to_tile = ['0']
+        tile_to_id      = {'0': 0}
+        
+        self.grid = array('H', [0]) * (width * height)
+        for y, row in enumerate(rows):
+            offset = y * width
+            for x, tile in enumerate(row):
+                id = tile_to_id.get(tile)
+                if id is None:
+                    id = tile_to_id[tile] = len(self.id_to_tile)
+                    self.id_to_tile.append(tile)
+                
+                self.grid[offset + x] = id
+        
+        # The columns holding a visible tile in each row, so drawing can skip
+        # runs of empty cells without looking at them.
+        self.occupied = []
+        for y in range(height):
+            offset = y * width
+            self.occupied.append(array('H', [x for x in range(width) if self.grid[offset + x]]))
     
     
     def get(self, x, y):
-        x = x % self.width
-        y = y % self.height
+        return self.id_to_tile[self.grid[(y % self.height) * self.width + x % self.width]]
+    
+    
+    def occupied_cells(self, y, start, end):
+        columns = self.occupied[y]
+        offset  = y * self.width
+        grid    = self.grid
         
-        row = self.rows[y]
-        if x >= len(row):
-            return '0'
-        else:
-            return row[x]
-            
+        for x in columns[bisect_left(columns, start):bisect_left(columns, end)]:
+            yield x, grid[offset + x]
@@ -0,0 +1,32 @@
+import os
+import sys
+import tempfile
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import micro
+
+
+class InitTest(unittest.TestCase):
+    def tearDown(self):
+        micro.quit()
+
+
+    def test_resources_dir(self):
+        with tempfile.TemporaryDirectory() as resources_dir:
+            micro.init(resources_dir=resources_dir, redirect_output=False)
+            self.assertEqual(micro.resolution(), (320, 180))
+
+
+    def test_resources_dir_must_exist(self):
+        with tempfile.TemporaryDirectory() as parent:
+            with self.assertRaises(ValueError):
+                micro.init(resources_dir=os.path.join(parent, 'missing'))
+
+
+if __name__ == '__main__':
+    unittest.main()
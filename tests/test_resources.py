@@ -0,0 +1,35 @@
+import os
+import sys
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import micro
+
+
+class ResourceManagerTest(unittest.TestCase):
+    def setUp(self):
+        micro.init(redirect_output=False)
+        self.resources = micro.init.__self__.resources
+
+
+    def tearDown(self):
+        micro.quit()
+
+
+    def test_internal_name_is_cached(self):
+        white = self.resources.get_image('.white', internal=True)
+        self.assertIs(self.resources.get_image('.white', internal=True), white)
+
+
+    def test_public_lookup_of_internal_name_raises(self):
+        self.resources.get_image('.white', internal=True)
+        with self.assertRaises(ValueError):
+            self.resources.get_image('.white')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import os
+import sys
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import micro
+
+
+class DrawTextTest(unittest.TestCase):
+    def setUp(self):
+        micro.init(redirect_output=False)
+        self.api = micro.init.__self__
+
+
+    def tearDown(self):
+        micro.quit()
+
+
+    def test_builtin_font_uses_glyph_atlas(self):
+        micro.draw_text('Hello', 0, 0)
+
+        atlases = [atlas for atlas in self.api._font_atlases.values() if atlas is not None]
+        self.assertEqual(len(atlases), 1)
+        self.assertEqual(self.api.g.x, atlases[0].advance * len('Hello'))
+        self.assertEqual(len(self.api._text_cache), 0)
+
+
+    def test_non_ascii_text_uses_line_cache(self):
+        micro.draw_text('café', 0, 0)
+
+        self.assertEqual(len(self.api._text_cache), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()